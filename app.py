@@ -21,13 +21,67 @@ from src.data.loaders import (
     sport_display_to_column,
 )
 from src.data.processors import merge_all_data, calculate_religious_need_score, calculate_missionary_gap_score
-from src.visualization.maps import create_choropleth
-from src.visualization.tables import format_rankings_dataframe
-from src.visualization.charts import (
-    create_score_breakdown_chart,
-    create_scatter_plot,
-)
-from src.utils.normalization import min_max_normalize
+from src.visualization.tables import display_rankings_table, format_population
+from src.utils.normalization import rank_descending
+
+# Copy-on-Write is always on from pandas 3 (where the option is deprecated);
+# opt in on pandas 2 so renames and slices share data until written
+if int(pd.__version__.split('.')[0]) < 3:
+    pd.set_option('mode.copy_on_write', True)
+
+
+# Plotly client config: drop the mode bar and scroll zoom to cut browser layout work
+PLOTLY_CONFIG = {
+    'displayModeBar': False,
+    'scrollZoom': False,
+}
+
+# Numeric inputs to the score components, stored as float32 in the base data
+SCORE_INPUT_COLUMNS = [
+    'pct_evangelical',
+    'pct_christian',
+    'pct_unreached',
+    'persecution_score',
+    'legal_openness',
+    'ttdi_score',
+]
+
+# Decimals kept when upcasting the float32 score inputs back to float64
+SCORE_INPUT_DECIMALS = 4
+
+# Text columns held as Arrow-backed strings, so the search and display string
+# ops run on Arrow's vectorized kernels instead of per-object Python loops
+# (continent and primary_religion are categoricals from the loader)
+STRING_COLUMNS = [
+    'country_name',
+    'iso_alpha_3',
+    '_name_lower',
+]
+
+# TTDI score range, mapped onto the 0-100 Tourism Infrastructure component
+TTDI_MIN = 1.0
+TTDI_MAX = 6.0
+
+# Natural Resources proxy: base score plus a bonus for continents known
+# for adventure sports
+NATURAL_RESOURCES_BASE = 60.0
+NATURAL_RESOURCES_BY_CONTINENT = {
+    'Oceania': NATURAL_RESOURCES_BASE + 20,
+    'Latin America': NATURAL_RESOURCES_BASE + 15,
+    'Africa': NATURAL_RESOURCES_BASE + 15,
+    'Europe': NATURAL_RESOURCES_BASE + 10,
+    'Asia': NATURAL_RESOURCES_BASE + 10,
+    'North America': NATURAL_RESOURCES_BASE + 10,
+}
+
+# Score types shown in the tabs
+SCORE_TYPES = ('combined', 'action_sports', 'outreach')
+
+# Sidebar slider step; weights are quantized to it before keying the rankings
+WEIGHT_STEP = 0.05
+
+# Rows per page of the rankings table; only the current page is sent to the browser
+RANKINGS_PAGE_SIZE = 20
 
 
 # Page configuration
@@ -46,117 +100,220 @@ def load_base_data():
     if merged.empty:
         st.error("No data available. Please check data files in data/raw/")
         return pd.DataFrame()
+
+    # Store score inputs as float32 and consolidate them into one column-major
+    # block, which is what the columnwise fillna/clip in the scoring favors.
+    # Population stays int64 since float32 cannot hold it exactly.
+    score_input_cols = [c for c in SCORE_INPUT_COLUMNS if c in merged.columns]
+    merged[score_input_cols] = merged[score_input_cols].astype(np.float32)
+    merged = merged.copy()
+    score_inputs = merged[score_input_cols].to_numpy()
+    assert score_inputs.dtype == np.float32 and score_inputs.flags['F_CONTIGUOUS'], (
+        "score inputs must stay a column-major float32 block"
+    )
+
+    # Normalize the display name column so downstream code can rely on it
+    if 'country_name' not in merged.columns and 'Country' in merged.columns:
+        merged = merged.rename(columns={'Country': 'country_name'})
+
+    # Lowercased names for the rankings search box, computed once per load
+    merged['_name_lower'] = [str(name).lower() for name in merged['country_name'].fillna('')]
+
+    # Display-formatted population, picked up by format_rankings_dataframe
+    if 'population' in merged.columns:
+        merged['population_fmt'] = format_population(merged['population'])
+
+    # pandas 3 already infers Arrow-backed strings; older versions give object
+    object_cols = [c for c in STRING_COLUMNS if c in merged.columns and merged[c].dtype == object]
+    if object_cols:
+        merged = merged.astype(dict.fromkeys(object_cols, 'string[pyarrow]'))
+
+    # Sorted country list for the detail selectbox
+    merged.attrs['countries'] = tuple(sorted(merged['country_name'].dropna().unique().tolist()))
+
+    # Content hash used as the cache key for everything derived from this frame
+    merged.attrs['data_version'] = str(pd.util.hash_pandas_object(merged, index=False).sum())
+
     return merged
 
 
-def calculate_action_sports_score_weighted(
-    df: pd.DataFrame,
-    tourism_infra_weight: float = 0.40,
-    safety_weight: float = 0.30,
-    natural_resources_weight: float = 0.30
-) -> pd.Series:
-    """Calculate Action Sports Score with custom weights.
+def compute_score_components(df: pd.DataFrame) -> dict:
+    """Compute the weight-independent score components on a 0-100 scale.
+
+    Only the final linear combination depends on the sidebar weights, so
+    these arrays can be built once per data load and reused on every
+    slider change.
 
     Components:
-    - Tourism Infrastructure: From TTDI score
-    - Safety: Inverse of persecution (countries with less persecution are safer)
-    - Natural Resources: Proxy based on continent/region diversity
+    - tourism_infra: From TTDI score
+    - safety: Inverse of persecution (countries with less persecution are safer)
+    - natural_resources: Proxy based on continent/region diversity
+    - religious_need, missionary_gap: From religious demographics
+    - legal_openness: Inverse of persecution
+
+    Args:
+        df: Merged base DataFrame
+
+    Returns:
+        Dict mapping component name to a clipped NumPy array aligned with df
     """
+    n = len(df)
+
+    # Upcast the float32 inputs once, before any arithmetic. Rounding restores
+    # the exact float64 values the sources parse to (they carry at most two
+    # decimals, well within float32 precision), so scores and near-tied ranks
+    # match a float64 pipeline exactly.
+    input_cols = [c for c in SCORE_INPUT_COLUMNS if c in df.columns]
+    df = df.assign(**{
+        col: df[col].astype(np.float64).round(SCORE_INPUT_DECIMALS) for col in input_cols
+    })
 
     # Tourism Infrastructure from TTDI
     if 'ttdi_score' in df.columns:
-        ttdi = df['ttdi_score'].fillna(df['ttdi_score'].median())
-        tourism_infra = min_max_normalize(
-            ttdi,
-            min_val=1.0,
-            max_val=6.0,
-            target_min=0,
-            target_max=100
-        )
+        # TTDI runs 1-6; min-max scaled to 0-100 in place on a private float64
+        # copy, in min_max_normalize's operation order so results match it
+        tourism_infra = np.array(df['ttdi_score'], dtype=np.float64)
+        np.nan_to_num(tourism_infra, copy=False, nan=np.nanmedian(tourism_infra))
+        tourism_infra -= TTDI_MIN
+        tourism_infra /= TTDI_MAX - TTDI_MIN
+        tourism_infra *= 100.0
+        np.clip(tourism_infra, 0, 100, out=tourism_infra)
     else:
-        tourism_infra = pd.Series([50.0] * len(df), index=df.index)
+        tourism_infra = np.full(n, 50.0)
 
-    # Safety score (inverse of persecution - less persecution = safer for travelers)
+    # Inverse of persecution, shared by Safety and Legal Openness. Countries not
+    # in WWL get a persecution score of 0 (no data = likely safe and open).
     if 'persecution_score' in df.columns:
-        # Countries not in WWL get score of 0 (no persecution data = likely safe)
-        persecution = df['persecution_score'].fillna(0)
-        safety = 100 - persecution  # Invert: high persecution = low safety
+        persecution = np.nan_to_num(df['persecution_score'].to_numpy(dtype=np.float64), nan=0.0)
+        persecution_inverted = np.clip(100.0 - persecution, 0, 100)
+    else:
+        persecution_inverted = None
+
+    # Safety score (less persecution = safer for travelers)
+    if persecution_inverted is not None:
+        safety = persecution_inverted
     elif 'legal_openness' in df.columns:
-        safety = df['legal_openness'].fillna(100)
+        safety = np.nan_to_num(df['legal_openness'].to_numpy(dtype=np.float64), nan=100.0)
     else:
-        safety = pd.Series([75.0] * len(df), index=df.index)
+        safety = np.full(n, 75.0)
 
     # Natural Resources proxy - based on geographic diversity
     # Countries with varied terrain score higher (this is an approximation)
     # Using continent as a rough proxy for now
-    natural_resources = pd.Series([60.0] * len(df), index=df.index)
     if 'continent' in df.columns:
-        # Boost scores for continents known for adventure sports
-        continent_bonuses = {
-            'Oceania': 20,
-            'Latin America': 15,
-            'Africa': 15,
-            'Europe': 10,
-            'Asia': 10,
-            'North America': 10,
-        }
-        for continent, bonus in continent_bonuses.items():
-            mask = df['continent'] == continent
-            natural_resources.loc[mask] = 60 + bonus
+        natural_resources = (
+            df['continent'].map(NATURAL_RESOURCES_BY_CONTINENT)
+            .to_numpy(dtype=np.float64, na_value=NATURAL_RESOURCES_BASE)
+        )
+    else:
+        natural_resources = np.full(n, NATURAL_RESOURCES_BASE)
+
+    # Outreach components
+    religious_need = calculate_religious_need_score(df).to_numpy(dtype=np.float64)
+    missionary_gap = calculate_missionary_gap_score(df).to_numpy(dtype=np.float64)
 
-    # Normalize weights to sum to 1
-    total_weight = tourism_infra_weight + safety_weight + natural_resources_weight
+    # Legal openness: the same inverted array as Safety, not a second copy
+    if persecution_inverted is not None:
+        legal_openness = persecution_inverted
+    elif 'legal_openness' in df.columns:
+        legal_openness = np.nan_to_num(df['legal_openness'].to_numpy(dtype=np.float64), nan=100.0)
+    else:
+        legal_openness = np.full(n, 100.0)
+
+    components = {
+        'tourism_infra': tourism_infra,
+        'safety': safety,
+        'natural_resources': natural_resources,
+        'religious_need': religious_need,
+        'missionary_gap': missionary_gap,
+        'legal_openness': legal_openness,
+    }
+    # Clip each distinct array once; shared arrays stay shared
+    clipped = {}
+    for name, arr in components.items():
+        if arr is not persecution_inverted:
+            arr = np.clip(arr, 0, 100)
+        clipped[name] = arr
+    return clipped
+
+
+@st.cache_data(ttl=3600)
+def _cached_score_components(_base_df: pd.DataFrame, data_version: str) -> dict:
+    """Compute score components once per base data load."""
+    return compute_score_components(_base_df)
+
+
+def _normalize_weights(weights: list) -> list:
+    """Scale weights to sum to 1, leaving all-zero weights unchanged."""
+    total_weight = sum(weights)
     if total_weight > 0:
-        tourism_infra_weight /= total_weight
-        safety_weight /= total_weight
-        natural_resources_weight /= total_weight
-
-    # Calculate weighted score
-    action_score = (
-        tourism_infra_weight * tourism_infra.clip(0, 100) +
-        safety_weight * safety.clip(0, 100) +
-        natural_resources_weight * natural_resources.clip(0, 100)
-    )
+        return [w / total_weight for w in weights]
+    return list(weights)
+
+
+def _weighted_score(df: pd.DataFrame, arrays: list, weights: list) -> pd.Series:
+    """Combine component arrays with weights normalized to sum to 1, clipped to 0-100."""
+    weights = _normalize_weights(weights)
+
+    # Accumulate into one output buffer, reusing a single scratch array
+    score = np.multiply(arrays[0], weights[0])
+    scratch = np.empty_like(score)
+    for arr, weight in zip(arrays[1:], weights[1:]):
+        np.multiply(arr, weight, out=scratch)
+        np.add(score, scratch, out=score)
+    np.clip(score, 0, 100, out=score)
+
+    return pd.Series(score, index=df.index)
+
 
-    return action_score.clip(0, 100)
+def calculate_action_sports_score_weighted(
+    df: pd.DataFrame,
+    tourism_infra_weight: float = 0.40,
+    safety_weight: float = 0.30,
+    natural_resources_weight: float = 0.30,
+    components: dict = None,
+) -> pd.Series:
+    """Calculate Action Sports Score with custom weights.
+
+    Components:
+    - Tourism Infrastructure: From TTDI score
+    - Safety: Inverse of persecution (countries with less persecution are safer)
+    - Natural Resources: Proxy based on continent/region diversity
+
+    Pass precomputed ``components`` (from compute_score_components) to skip
+    rebuilding them.
+    """
+    if components is None:
+        components = compute_score_components(df)
+
+    return _weighted_score(
+        df,
+        [components['tourism_infra'], components['safety'], components['natural_resources']],
+        [tourism_infra_weight, safety_weight, natural_resources_weight],
+    )
 
 
 def calculate_outreach_score_weighted(
     df: pd.DataFrame,
     religious_need_weight: float = 0.40,
     missionary_gap_weight: float = 0.25,
-    legal_openness_weight: float = 0.35
+    legal_openness_weight: float = 0.35,
+    components: dict = None,
 ) -> pd.Series:
-    """Calculate Outreach Score with custom weights."""
-
-    # Calculate component scores
-    religious_need = calculate_religious_need_score(df)
-    missionary_gap = calculate_missionary_gap_score(df)
+    """Calculate Outreach Score with custom weights.
 
-    # Legal openness (inverse of persecution)
-    if 'legal_openness' in df.columns:
-        legal_openness = df['legal_openness'].fillna(100)
-    elif 'persecution_score' in df.columns:
-        legal_openness = 100 - df['persecution_score'].fillna(0)
-    else:
-        legal_openness = pd.Series([100.0] * len(df), index=df.index)
+    Pass precomputed ``components`` (from compute_score_components) to skip
+    rebuilding them.
+    """
+    if components is None:
+        components = compute_score_components(df)
 
-    # Normalize weights to sum to 1
-    total_weight = religious_need_weight + missionary_gap_weight + legal_openness_weight
-    if total_weight > 0:
-        religious_need_weight /= total_weight
-        missionary_gap_weight /= total_weight
-        legal_openness_weight /= total_weight
-
-    # Calculate weighted score
-    outreach_score = (
-        religious_need_weight * religious_need.clip(0, 100) +
-        missionary_gap_weight * missionary_gap.clip(0, 100) +
-        legal_openness_weight * legal_openness.clip(0, 100)
+    return _weighted_score(
+        df,
+        [components['religious_need'], components['missionary_gap'], components['legal_openness']],
+        [religious_need_weight, missionary_gap_weight, legal_openness_weight],
     )
 
-    return outreach_score.clip(0, 100)
-
 
 def calculate_combined_score_weighted(
     action_score: pd.Series,
@@ -166,21 +323,25 @@ def calculate_combined_score_weighted(
     method: str = "multiply"
 ) -> pd.Series:
     """Calculate combined score with custom weights."""
+    a = action_score.to_numpy(dtype=np.float64)
+    o = outreach_score.to_numpy(dtype=np.float64)
+    combined = np.empty_like(a)
 
-    if method == "multiply":
-        # Multiply and scale back to 0-100
-        combined = (action_score * outreach_score) / 100
-    elif method == "weighted_average":
+    if method == "weighted_average":
         # Normalize weights
         total = action_weight + outreach_weight
         if total > 0:
             action_weight /= total
             outreach_weight /= total
-        combined = (action_weight * action_score) + (outreach_weight * outreach_score)
+        np.multiply(a, action_weight, out=combined)
+        combined += outreach_weight * o
     else:
-        combined = (action_score * outreach_score) / 100
+        # Multiply and scale back to 0-100
+        np.multiply(a, o, out=combined)
+        combined /= 100
 
-    return combined.clip(0, 100)
+    np.clip(combined, 0, 100, out=combined)
+    return pd.Series(combined, index=action_score.index)
 
 
 def generate_rankings_with_weights(
@@ -188,58 +349,125 @@ def generate_rankings_with_weights(
     action_sports_weights: dict,
     outreach_weights: dict,
     combined_weights: dict,
-    combination_method: str = "multiply"
+    combination_method: str = "multiply",
+    components: dict = None,
 ) -> pd.DataFrame:
-    """Generate rankings with custom weights."""
+    """Generate rankings with custom weights.
+
+    ``components`` may be passed from compute_score_components to reuse
+    weight-independent work across calls.
+    """
 
-    result = df.copy()
+    if components is None:
+        components = compute_score_components(df)
+
+    # Build only the new columns; df is the cached base frame and is never mutated
+    new_cols = {}
 
     # Calculate Action Sports Score with custom weights
-    result['action_sports_score'] = calculate_action_sports_score_weighted(
-        result,
+    new_cols['action_sports_score'] = calculate_action_sports_score_weighted(
+        df,
         tourism_infra_weight=action_sports_weights.get('tourism_infra', 0.40),
         safety_weight=action_sports_weights.get('safety', 0.30),
-        natural_resources_weight=action_sports_weights.get('natural_resources', 0.30)
+        natural_resources_weight=action_sports_weights.get('natural_resources', 0.30),
+        components=components,
     )
 
     # Calculate Outreach Score with custom weights
-    result['outreach_score'] = calculate_outreach_score_weighted(
-        result,
+    new_cols['outreach_score'] = calculate_outreach_score_weighted(
+        df,
         religious_need_weight=outreach_weights.get('religious_need', 0.40),
         missionary_gap_weight=outreach_weights.get('missionary_gap', 0.25),
-        legal_openness_weight=outreach_weights.get('legal_openness', 0.35)
+        legal_openness_weight=outreach_weights.get('legal_openness', 0.35),
+        components=components,
     )
 
     # Calculate Combined Score
-    result['combined_score'] = calculate_combined_score_weighted(
-        result['action_sports_score'],
-        result['outreach_score'],
+    new_cols['combined_score'] = calculate_combined_score_weighted(
+        new_cols['action_sports_score'],
+        new_cols['outreach_score'],
         action_weight=combined_weights.get('action_sports', 0.5),
         outreach_weight=combined_weights.get('outreach', 0.5),
         method=combination_method
     )
 
-    # Generate rankings
-    result['action_sports_rank'] = result['action_sports_score'].rank(
-        ascending=False, method='min'
-    ).astype(int)
+    # Generate rankings (higher score = better rank = lower number).
+    # Ranks come from the full-precision scores; int16 holds any country count.
+    for score_type in SCORE_TYPES:
+        new_cols[f'{score_type}_rank'] = rank_descending(
+            new_cols[f'{score_type}_score']
+        ).astype(np.int16)
 
-    result['outreach_rank'] = result['outreach_score'].rank(
-        ascending=False, method='min'
-    ).astype(int)
+    # Round scores for display; they stay float64, since float32 cannot hold
+    # one-decimal values exactly (81.8 would be shown as 81.800003)
+    for score_type in SCORE_TYPES:
+        new_cols[f'{score_type}_score'] = new_cols[f'{score_type}_score'].round(1)
 
-    result['combined_rank'] = result['combined_score'].rank(
-        ascending=False, method='min'
-    ).astype(int)
-
-    # Round scores
-    result['action_sports_score'] = result['action_sports_score'].round(1)
-    result['outreach_score'] = result['outreach_score'].round(1)
-    result['combined_score'] = result['combined_score'].round(1)
+    result = df.drop(columns=list(new_cols), errors='ignore').join(
+        pd.DataFrame(new_cols, index=df.index)
+    )
 
     return result.sort_values('combined_rank')
 
 
+@st.cache_data(ttl=3600, max_entries=64)
+def _rankings_cached(
+    _base_df: pd.DataFrame,
+    data_version: str,
+    action_items: tuple,
+    outreach_items: tuple,
+    combined_items: tuple,
+    combination_method: str,
+) -> pd.DataFrame:
+    """Memoize generate_rankings_with_weights on a hashable weight key.
+
+    Slider steps are quantized to 0.05, so revisiting a weight combination
+    becomes a cache lookup instead of a full rescore.
+
+    Args:
+        _base_df: Cached base DataFrame (not hashed)
+        data_version: Content hash identifying ``_base_df``
+        action_items: Sorted (name, weight) pairs for the Action Sports Score
+        outreach_items: Sorted (name, weight) pairs for the Outreach Score
+        combined_items: Sorted (name, weight) pairs for the Combined Score
+        combination_method: How the two scores are combined
+
+    Returns:
+        DataFrame with scores and rankings
+    """
+    return generate_rankings_with_weights(
+        _base_df,
+        action_sports_weights=dict(action_items),
+        outreach_weights=dict(outreach_items),
+        combined_weights=dict(combined_items),
+        combination_method=combination_method,
+        components=_cached_score_components(_base_df, data_version),
+    )
+
+
+def _weight_key(weights: dict) -> tuple:
+    """Build a hashable key from the sidebar weights, quantized to WEIGHT_STEP.
+
+    Args:
+        weights: Dict returned by render_weight_sidebar
+
+    Returns:
+        Tuple of sorted (name, weight) pairs per group plus the combination method
+    """
+    def quantize(group):
+        return tuple(
+            (name, round(round(value / WEIGHT_STEP) * WEIGHT_STEP, 2))
+            for name, value in sorted(group.items())
+        )
+
+    return (
+        quantize(weights['action_sports_weights']),
+        quantize(weights['outreach_weights']),
+        quantize(weights['combined_weights']),
+        weights['combination_method'],
+    )
+
+
 def get_default_weights():
     """Return default weight values."""
     return {
@@ -474,23 +702,22 @@ def get_top_countries(df: pd.DataFrame, score_type: str = "combined", top_n: int
     rank_col = f"{score_type}_rank"
     if rank_col not in df.columns:
         return df.head(top_n)
-    return df.nsmallest(top_n, rank_col)
-
-
-def get_country_details(df: pd.DataFrame, country_name: str) -> dict:
-    """Get detailed information for a specific country."""
-    country_row = df[df['country_name'] == country_name]
-
-    if country_row.empty:
-        country_row = df[df['Country'] == country_name]
 
-    if country_row.empty:
-        return None
+    ranks = df[rank_col].to_numpy()
+    if top_n < len(ranks):
+        # Linear-time partial selection; only the winners get sorted
+        idx = np.argpartition(ranks, top_n)[:top_n]
+    else:
+        idx = np.arange(len(ranks))
+    # Order by rank, breaking ties by original position
+    idx = idx[np.lexsort((idx, ranks[idx]))]
+    return df.iloc[idx]
 
-    row = country_row.iloc[0]
 
+def _build_country_details(row, country_name: str = None) -> dict:
+    """Build the country detail dict from a rankings row (Series or record dict)."""
     return {
-        'name': row.get('country_name', row.get('Country', country_name)),
+        'name': row.get('country_name', country_name),
         'iso_code': row.get('iso_alpha_3', ''),
         'continent': row.get('continent', ''),
         'population': row.get('population', 0),
@@ -517,6 +744,33 @@ def get_country_details(df: pd.DataFrame, country_name: str) -> dict:
     }
 
 
+def get_country_details(df: pd.DataFrame, country_name: str) -> dict:
+    """Get detailed information for a specific country."""
+    country_row = df[df['country_name'] == country_name]
+
+    if country_row.empty:
+        return None
+
+    return _build_country_details(country_row.iloc[0], country_name)
+
+
+@st.cache_resource(max_entries=16)
+def _name_positions(_df: pd.DataFrame, df_token: str) -> dict:
+    """Build a country name -> row position lookup once per rankings set.
+
+    Args:
+        _df: Rankings DataFrame (not hashed)
+        df_token: Content hash identifying ``_df``
+
+    Returns:
+        Dict mapping country name to its positional index in ``_df``
+    """
+    positions = {}
+    for pos, name in enumerate(_df['country_name'].tolist()):
+        positions.setdefault(name, pos)
+    return positions
+
+
 def render_header():
     """Render the page header."""
     st.title("Mission-Action")
@@ -536,73 +790,158 @@ def render_header():
         st.metric("Last Updated", "January 2025")
 
 
+def _df_token(df: pd.DataFrame, columns: list) -> str:
+    """Build a cheap content hash of the given columns for use as a cache key.
+
+    Cached helpers take the frame as an underscore-prefixed (unhashed)
+    argument plus this token, so Streamlit hashes a short string per
+    lookup instead of the whole DataFrame.
+    """
+    available_cols = [c for c in columns if c in df.columns]
+    return str(pd.util.hash_pandas_object(df[available_cols], index=False).sum())
+
+
+@st.cache_resource(max_entries=16)
+def _cached_choropleth(_df: pd.DataFrame, df_token: str, score_type: str, height: int = 500):
+    """Build a choropleth Figure once per (data, score type) and reuse it across reruns.
+
+    The leading underscore on ``_df`` tells Streamlit not to hash the frame;
+    ``df_token`` identifies its contents instead.
+    """
+    # Plotly is imported lazily so it only loads once a chart is built
+    from src.visualization.maps import create_choropleth
+
+    return create_choropleth(_df, score_type=score_type, height=height)
+
+
+@st.cache_resource(max_entries=16)
+def _cached_scatter_plot(_df: pd.DataFrame, df_token: str):
+    """Build the Action Sports vs Outreach scatter once per score set."""
+    from src.visualization.charts import create_scatter_plot
+
+    return create_scatter_plot(
+        _df,
+        x_score='action_sports_score',
+        y_score='outreach_score',
+        color_col='continent',
+    )
+
+
+@st.cache_resource(max_entries=64)
+def _cached_score_breakdown_chart(_details: dict, country_name: str, scores: tuple):
+    """Build a country's score breakdown chart once per (country, scores)."""
+    from src.visualization.charts import create_score_breakdown_chart
+
+    return create_score_breakdown_chart(_details, chart_type='bar')
+
+
+@st.cache_data(max_entries=16)
+def _ranked_views(_df: pd.DataFrame, df_token: str) -> dict:
+    """Sort the rankings once per score type and reuse the views across reruns.
+
+    Args:
+        _df: Rankings DataFrame (not hashed; identified by ``df_token``)
+        df_token: Content hash of the names, score and rank columns
+
+    Returns:
+        Dict mapping score type to the DataFrame sorted by that rank
+    """
+    return {
+        score_type: _df.sort_values(f'{score_type}_rank', kind='stable')
+        for score_type in SCORE_TYPES
+    }
+
+
+@st.cache_data(max_entries=16)
+def _continent_averages(_df: pd.DataFrame, df_token: str) -> pd.DataFrame:
+    """Average each score by continent, memoized on the score contents.
+
+    Args:
+        _df: Rankings DataFrame with a continent column (not hashed)
+        df_token: Content hash of the continent and score columns
+
+    Returns:
+        DataFrame of mean scores indexed by continent
+    """
+    score_cols = ['action_sports_score', 'outreach_score', 'combined_score']
+    return _df[score_cols].groupby(_df['continent']).mean().round(1)
+
+
 def render_map_section(df: pd.DataFrame, score_type: str):
     """Render the choropleth map section."""
     st.subheader("World Map")
 
+    # Hand the map only the columns it draws, keyed on just those columns, so
+    # a weight change that leaves this score type untouched reuses its figure
+    map_cols = [
+        c for c in ('iso_alpha_3', 'country_name', f'{score_type}_score', f'{score_type}_rank')
+        if c in df.columns
+    ]
+    map_df = df[map_cols]
+
     try:
-        fig = create_choropleth(df, score_type=score_type, height=500)
-        st.plotly_chart(fig, use_container_width=True, key=f"map_{score_type}")
+        fig = _cached_choropleth(map_df, _df_token(map_df, map_cols), score_type, height=500)
+        st.plotly_chart(fig, use_container_width=True, key=f"map_{score_type}", config=PLOTLY_CONFIG)
     except Exception as e:
         st.error(f"Error rendering map: {e}")
 
 
-def render_rankings_section(df: pd.DataFrame, score_type: str):
-    """Render the rankings table section."""
+@st.fragment
+def render_rankings_section(df: pd.DataFrame, score_type: str, df_token: str):
+    """Render the rankings table section.
+
+    Runs as a fragment, so typing in the search box reruns only this section.
+
+    Args:
+        df: Rankings DataFrame already sorted by ``{score_type}_rank``
+        score_type: Score type shown in this section
+        df_token: Content hash identifying ``df`` for caching
+    """
     col1, col2 = st.columns([2, 1])
 
     with col1:
         st.subheader("Country Rankings")
 
-        search = st.text_input(
-            "Search countries",
-            placeholder="Type to search...",
-            key=f"search_{score_type}"
-        )
-
-        filtered_df = df.copy()
-        if search:
-            name_col = 'country_name' if 'country_name' in df.columns else 'Country'
-            filtered_df = df[
-                df[name_col].str.lower().str.contains(search.lower(), na=False)
-            ]
-
-        display_cols = ['country_name', f'{score_type}_rank', f'{score_type}_score']
-        if score_type != 'action_sports':
-            display_cols.append('action_sports_score')
-        if score_type != 'outreach':
-            display_cols.append('outreach_score')
-        if score_type != 'combined':
-            display_cols.append('combined_score')
-        display_cols.append('continent')
-
-        available_cols = [c for c in display_cols if c in filtered_df.columns]
-
-        formatted = format_rankings_dataframe(filtered_df[available_cols])
-        st.dataframe(
-            formatted,
-            use_container_width=True,
-            height=400,
-            hide_index=True,
-            key=f"rankings_table_{score_type}"
+        # Selected score first, then the other two scores and the continent
+        display_cols = [
+            'country_name',
+            f'{score_type}_rank',
+            f'{score_type}_score',
+            *(f'{other}_score' for other in ('action_sports', 'outreach', 'combined')
+              if other != score_type),
+            'continent',
+        ]
+
+        # Searches, paginates and sends only the current page to the browser
+        display_rankings_table(
+            df,
+            score_type=score_type,
+            page_size=RANKINGS_PAGE_SIZE,
+            df_token=df_token,
+            columns=display_cols,
         )
 
     with col2:
         st.subheader("Top 10 Countries")
 
-        top_10 = get_top_countries(df, score_type=score_type, top_n=10)
-        name_col = 'country_name' if 'country_name' in top_10.columns else 'Country'
+        top_10 = df.head(10)
 
-        for i, (_, row) in enumerate(top_10.iterrows(), 1):
-            score = row.get(f'{score_type}_score', 0)
-            st.markdown(f"**{i}. {row[name_col]}** — {score:.1f}")
+        # One markdown block instead of one element per country; plain arrays
+        # avoid per-row Series and the fixed cost of pandas string ops
+        names = top_10['country_name'].to_numpy()
+        scores = top_10[f'{score_type}_score'].to_numpy()
+        st.markdown("\n\n".join(
+            f"**{i}. {name}** — {score:.1f}"
+            for i, (name, score) in enumerate(zip(names, scores), 1)
+        ))
 
 
-def render_country_detail(df: pd.DataFrame, country_name: str):
+def render_country_detail(df: pd.DataFrame, country_name: str, df_token: str):
     """Render detailed information for a selected country."""
     st.subheader(f"Country Details: {country_name}")
 
-    details = get_country_details(df, country_name)
+    pos = _name_positions(df, df_token).get(country_name)
+    details = _build_country_details(df.iloc[pos], country_name) if pos is not None else None
 
     if details is None:
         st.warning(f"No data found for {country_name}")
@@ -610,31 +949,58 @@ def render_country_detail(df: pd.DataFrame, country_name: str):
 
     col1, col2, col3 = st.columns(3)
 
+    # One markdown table per column instead of a widget per value
     with col1:
-        st.markdown("### Scores")
         scores = details.get('scores', {})
-        st.metric("Combined", f"{scores.get('combined', 0):.1f}")
-        st.metric("Action Sports", f"{scores.get('action_sports', 0):.1f}")
-        st.metric("Outreach", f"{scores.get('outreach', 0):.1f}")
+        st.markdown(
+            "### Scores\n\n"
+            "| Score | Value |\n"
+            "|---|---|\n"
+            f"| Combined | **{scores.get('combined', 0):.1f}** |\n"
+            f"| Action Sports | **{scores.get('action_sports', 0):.1f}** |\n"
+            f"| Outreach | **{scores.get('outreach', 0):.1f}** |"
+        )
 
     with col2:
-        st.markdown("### Rankings")
         ranks = details.get('ranks', {})
-        st.metric("Combined Rank", f"#{ranks.get('combined', '-')}")
-        st.metric("Action Sports Rank", f"#{ranks.get('action_sports', '-')}")
-        st.metric("Outreach Rank", f"#{ranks.get('outreach', '-')}")
+        st.markdown(
+            "### Rankings\n\n"
+            "| Ranking | Position |\n"
+            "|---|---|\n"
+            f"| Combined Rank | **#{ranks.get('combined', '-')}** |\n"
+            f"| Action Sports Rank | **#{ranks.get('action_sports', '-')}** |\n"
+            f"| Outreach Rank | **#{ranks.get('outreach', '-')}** |"
+        )
 
     with col3:
-        st.markdown("### Demographics")
         comps = details.get('components', {})
-        st.write(f"**Population:** {details.get('population', 0):,}")
-        st.write(f"**Primary Religion:** {details.get('primary_religion', 'N/A')}")
-        st.write(f"**% Christian:** {comps.get('pct_christian', 0):.1f}%")
-        st.write(f"**% Unreached:** {comps.get('pct_unreached', 0):.1f}%")
+        st.markdown(
+            "### Demographics\n\n"
+            f"**Population:** {details.get('population', 0):,}\n\n"
+            f"**Primary Religion:** {details.get('primary_religion', 'N/A')}\n\n"
+            f"**% Christian:** {comps.get('pct_christian', 0):.1f}%\n\n"
+            f"**% Unreached:** {comps.get('pct_unreached', 0):.1f}%"
+        )
 
     st.markdown("### Score Breakdown")
-    fig = create_score_breakdown_chart(details, chart_type='bar')
-    st.plotly_chart(fig, use_container_width=True, key="country_detail_chart")
+    scores = details.get('scores', {})
+    fig = _cached_score_breakdown_chart(
+        details,
+        details.get('name'),
+        (scores.get('action_sports', 0), scores.get('outreach', 0), scores.get('combined', 0)),
+    )
+    st.plotly_chart(fig, use_container_width=True, key="country_detail_chart", config=PLOTLY_CONFIG)
+
+
+@st.fragment
+def render_country_picker(df: pd.DataFrame, countries: tuple, df_token: str):
+    """Render the country selectbox and the selected country's details.
+
+    Runs as a fragment, so picking a country reruns only this section.
+    """
+    selected = st.selectbox("Select a country for details:", ("",) + countries, key="country_select")
+    if selected:
+        render_country_detail(df, selected, df_token)
 
 
 def render_methodology(weights: dict):
@@ -686,17 +1052,12 @@ def render_methodology(weights: dict):
         """)
 
 
-def render_scatter_analysis(df: pd.DataFrame):
+def render_scatter_analysis(df: pd.DataFrame, df_token: str):
     """Render scatter plot analysis."""
     st.subheader("Score Distribution Analysis")
 
-    fig = create_scatter_plot(
-        df,
-        x_score='action_sports_score',
-        y_score='outreach_score',
-        color_col='continent',
-    )
-    st.plotly_chart(fig, use_container_width=True, key="scatter_analysis")
+    fig = _cached_scatter_plot(df, df_token)
+    st.plotly_chart(fig, use_container_width=True, key="scatter_analysis", config=PLOTLY_CONFIG)
 
     st.markdown("""
     *Countries in the upper-right quadrant have both high action sports
@@ -721,14 +1082,16 @@ def main():
     # Render sidebar with weight controls
     weights = render_weight_sidebar()
 
-    # Calculate rankings with current weights
-    df = generate_rankings_with_weights(
-        base_df,
-        action_sports_weights=weights['action_sports_weights'],
-        outreach_weights=weights['outreach_weights'],
-        combined_weights=weights['combined_weights'],
-        combination_method=weights['combination_method']
-    )
+    # Calculate rankings with current weights. Reruns that leave the quantized
+    # weights unchanged (e.g. a filter or tab change) reuse the last result
+    # without touching the cache at all.
+    weight_key = (base_df.attrs['data_version'],) + _weight_key(weights)
+    if st.session_state.get('_last_weight_key') == weight_key:
+        df = st.session_state['_last_rankings']
+    else:
+        df = _rankings_cached(base_df, *weight_key)
+        st.session_state['_last_weight_key'] = weight_key
+        st.session_state['_last_rankings'] = df
 
     # Apply action sports filter if any sports are selected
     df = apply_action_sports_filter(df, selected_sports)
@@ -737,55 +1100,69 @@ def main():
     if selected_sports:
         st.sidebar.success(f"Showing {len(df)} countries with selected sports")
 
+    # Hash the rankings once per rerun; every cached view below is keyed on it
+    rankings_token = _df_token(
+        df,
+        ['country_name'] + [f'{s}_{kind}' for s in SCORE_TYPES for kind in ('score', 'rank')],
+    )
+
+    # Sort once per score type; reused by every rankings section
+    ranked_views = _ranked_views(df, rankings_token)
+
     # Header
     render_header()
 
     st.divider()
 
-    # Tab navigation
+    # Tab navigation. Tracking the selected tab makes a tab switch rerun the
+    # script, so only the open tab's maps, tables and charts are built.
     tab_combined, tab_action, tab_outreach, tab_analysis, tab_methodology = st.tabs([
         "Combined Rankings",
         "Action Sports",
         "Outreach Opportunity",
         "Analysis",
         "Methodology"
-    ])
-
-    with tab_combined:
-        render_map_section(df, 'combined')
-        render_rankings_section(df, 'combined')
-
-        st.divider()
-        name_col = 'country_name' if 'country_name' in df.columns else 'Country'
-        countries = sorted(df[name_col].dropna().unique())
-        selected = st.selectbox("Select a country for details:", [""] + list(countries), key="country_select")
-        if selected:
-            render_country_detail(df, selected)
-
-    with tab_action:
-        render_map_section(df, 'action_sports')
-        render_rankings_section(df, 'action_sports')
-
-    with tab_outreach:
-        render_map_section(df, 'outreach')
-        render_rankings_section(df, 'outreach')
-
-    with tab_analysis:
-        render_scatter_analysis(df)
-
-        st.divider()
-
-        st.subheader("Scores by Continent")
-        if 'continent' in df.columns:
-            continent_avg = df.groupby('continent').agg({
-                'action_sports_score': 'mean',
-                'outreach_score': 'mean',
-                'combined_score': 'mean',
-            }).round(1)
-            st.dataframe(continent_avg, use_container_width=True, key="continent_table")
-
-    with tab_methodology:
-        render_methodology(weights)
+    ], key="active_tab", on_change="rerun")
+
+    if tab_combined.open:
+        with tab_combined:
+            render_map_section(df, 'combined')
+            render_rankings_section(ranked_views['combined'], 'combined', rankings_token)
+
+            st.divider()
+            countries = base_df.attrs['countries']
+            if selected_sports:
+                # Keep the presorted order, restricted to countries that passed the filter
+                visible = set(df['country_name'].dropna())
+                countries = tuple(c for c in countries if c in visible)
+            render_country_picker(df, countries, rankings_token)
+
+    if tab_action.open:
+        with tab_action:
+            render_map_section(df, 'action_sports')
+            render_rankings_section(ranked_views['action_sports'], 'action_sports', rankings_token)
+
+    if tab_outreach.open:
+        with tab_outreach:
+            render_map_section(df, 'outreach')
+            render_rankings_section(ranked_views['outreach'], 'outreach', rankings_token)
+
+    if tab_analysis.open:
+        with tab_analysis:
+            render_scatter_analysis(df, rankings_token)
+
+            st.divider()
+
+            st.subheader("Scores by Continent")
+            if 'continent' in df.columns:
+                # Keyed on continents and scores only, so it survives rank-neutral reruns
+                stats_cols = ['continent'] + [f'{s}_score' for s in SCORE_TYPES]
+                continent_avg = _continent_averages(df, _df_token(df, stats_cols))
+                st.dataframe(continent_avg, use_container_width=True, key="continent_table")
+
+    if tab_methodology.open:
+        with tab_methodology:
+            render_methodology(weights)
 
     # Footer
     st.divider()
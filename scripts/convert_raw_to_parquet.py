@@ -0,0 +1,38 @@
+"""
+Convert the raw CSV inputs to Parquet siblings read by the app loaders.
+
+Re-run this script after editing any file in data/raw/:
+    python scripts/convert_raw_to_parquet.py
+"""
+
+from pathlib import Path
+
+import pandas as pd
+
+# Project root, used to locate data/raw
+project_root = Path(__file__).resolve().parent.parent
+
+# Raw CSVs with a Parquet sibling; action sports parquet is written by
+# scripts/generate_action_sports_data.py
+RAW_CSV_FILES = (
+    'joshua_project_countries.csv',
+    'open_doors_wwl_2025.csv',
+    'wef_ttdi_2024.csv',
+)
+
+
+def main():
+    """Write a zstd Parquet copy next to each raw CSV."""
+    data_dir = project_root / 'data' / 'raw'
+
+    for name in RAW_CSV_FILES:
+        csv_path = data_dir / name
+        output_path = csv_path.with_suffix('.parquet')
+
+        df = pd.read_csv(csv_path, engine='pyarrow')
+        df.to_parquet(output_path, index=False, compression='zstd')
+        print(f"Created {output_path} ({len(df)} rows)")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,19 @@
 """
-Generate action_sports_by_country.csv based on web research data.
+Generate action_sports_by_country.parquet (and a CSV copy) based on web research data.
 This script creates boolean mappings for 50 action sports across 238 countries.
 """
 
-import pandas as pd
+import sys
 from pathlib import Path
 
+import pandas as pd
+
+# Add project root to path
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.utils.country_codes import get_iso_alpha3
+
 # Define the 50 action sports with their column names
 ACTION_SPORTS = {
     # Water Sports - Coastal (10)
@@ -72,7 +80,7 @@ ACTION_SPORTS = {
 }
 
 # Landlocked countries (44) - NO ocean sports
-LANDLOCKED = {
+LANDLOCKED = frozenset({
     # Africa (16)
     'Botswana', 'Burkina Faso', 'Burundi', 'Central African Republic',
     'Chad', 'Ethiopia', 'Lesotho', 'Malawi', 'Mali', 'Niger',
@@ -88,10 +96,10 @@ LANDLOCKED = {
     'Turkmenistan', 'Uzbekistan',
     # South America (2)
     'Bolivia', 'Paraguay',
-}
+})
 
 # Countries with skiing infrastructure (67+)
-SKIING_COUNTRIES = {
+SKIING_COUNTRIES = frozenset({
     # Europe
     'Austria', 'Switzerland', 'France', 'Italy', 'Germany', 'Spain',
     'Andorra', 'Norway', 'Sweden', 'Finland', 'Iceland', 'Poland',
@@ -117,10 +125,10 @@ SKIING_COUNTRIES = {
     'Morocco', 'South Africa', 'Lesotho',
     # Middle East
     'Saudi Arabia', 'United Arab Emirates', 'Qatar',  # Indoor
-}
+})
 
 # Countries with surfing (120+)
-SURFING_COUNTRIES = {
+SURFING_COUNTRIES = frozenset({
     # Europe
     'Portugal', 'Spain', 'France', 'Ireland', 'United Kingdom',
     'Iceland', 'Norway', 'Sweden', 'Denmark', 'Finland',
@@ -159,7 +167,7 @@ SURFING_COUNTRIES = {
     'Cook Islands', 'French Polynesia', 'Kiribati', 'Tuvalu',
     'Marshall Islands', 'Micronesia Federated States', 'Palau', 'Guam',
     'Northern Mariana Islands',
-}
+})
 
 # Countries with scuba diving (nearly all coastal)
 SCUBA_DIVING_COUNTRIES = SURFING_COUNTRIES.union({
@@ -173,7 +181,7 @@ SCUBA_DIVING_COUNTRIES = SURFING_COUNTRIES.union({
 })
 
 # Countries with rock climbing (100+)
-ROCK_CLIMBING_COUNTRIES = {
+ROCK_CLIMBING_COUNTRIES = frozenset({
     # Europe
     'Austria', 'Belgium', 'France', 'Germany', 'Luxembourg', 'Netherlands',
     'Switzerland', 'Greece', 'Italy', 'Malta', 'Portugal', 'Spain',
@@ -202,10 +210,10 @@ ROCK_CLIMBING_COUNTRIES = {
     # Oceania
     'Australia', 'French Polynesia', 'Guam', 'Kiribati', 'New Caledonia',
     'New Zealand', 'Papua New Guinea', 'Samoa', 'Tonga', 'Vanuatu',
-}
+})
 
 # Countries with white water rafting (73)
-WHITE_WATER_RAFTING_COUNTRIES = {
+WHITE_WATER_RAFTING_COUNTRIES = frozenset({
     # North America
     'United States', 'Canada', 'Mexico',
     # Central America
@@ -230,10 +238,10 @@ WHITE_WATER_RAFTING_COUNTRIES = {
     'Malaysia', 'Indonesia', 'Sri Lanka',
     # Oceania
     'Australia', 'New Zealand', 'Fiji',
-}
+})
 
 # Countries with paragliding (90+)
-PARAGLIDING_COUNTRIES = {
+PARAGLIDING_COUNTRIES = frozenset({
     # Europe
     'Albania', 'Austria', 'Belgium', 'Bosnia-Herzegovina', 'Bulgaria',
     'Croatia', 'Czechia', 'Denmark', 'Finland', 'France', 'Georgia',
@@ -257,10 +265,10 @@ PARAGLIDING_COUNTRIES = {
     'Dominican Republic',
     # Oceania
     'Australia', 'New Zealand',
-}
+})
 
 # Countries with skydiving (97+)
-SKYDIVING_COUNTRIES = {
+SKYDIVING_COUNTRIES = frozenset({
     # Europe
     'Austria', 'Belgium', 'Bosnia-Herzegovina', 'Bulgaria', 'Croatia',
     'Cyprus', 'Czechia', 'Denmark', 'Estonia', 'Finland', 'France',
@@ -284,10 +292,10 @@ SKYDIVING_COUNTRIES = {
     'Bahamas', 'Belize',
     # Oceania
     'Australia', 'New Zealand',
-}
+})
 
 # Countries with kitesurfing (95+)
-KITESURFING_COUNTRIES = {
+KITESURFING_COUNTRIES = frozenset({
     # Europe
     'Austria', 'Croatia', 'Denmark', 'Finland', 'France', 'Germany',
     'Greece', 'Iceland', 'Ireland', 'Italy', 'Montenegro', 'Netherlands',
@@ -312,10 +320,10 @@ KITESURFING_COUNTRIES = {
     'Uruguay',
     # Oceania
     'Australia', 'Fiji', 'New Zealand', 'Tokelau',
-}
+})
 
 # Countries with bungee jumping (50)
-BUNGEE_JUMPING_COUNTRIES = {
+BUNGEE_JUMPING_COUNTRIES = frozenset({
     # Africa
     'South Africa', 'Zimbabwe', 'Zambia', 'Kenya', 'Uganda',
     # Asia
@@ -334,10 +342,10 @@ BUNGEE_JUMPING_COUNTRIES = {
     'Ecuador', 'Peru', 'Brazil', 'Argentina', 'Chile',
     # Oceania
     'Australia', 'New Zealand',
-}
+})
 
 # High tourism infrastructure countries (TTDI > 3.0) - for universal sports
-HIGH_TOURISM_COUNTRIES = {
+HIGH_TOURISM_COUNTRIES = frozenset({
     'United States', 'Spain', 'France', 'Japan', 'Italy', 'Germany',
     'United Kingdom', 'Australia', 'Switzerland', 'Singapore', 'Austria',
     'Netherlands', 'South Korea', 'Canada', 'Portugal', 'Sweden', 'Norway',
@@ -352,7 +360,36 @@ HIGH_TOURISM_COUNTRIES = {
     'Bahamas', 'Barbados', 'Trinidad and Tobago', 'Colombia', 'Peru',
     'Ecuador', 'Uruguay', 'Philippines', 'Sri Lanka', 'Nepal', 'Oman',
     'Jordan', 'Mauritius', 'Seychelles', 'Maldives', 'Fiji',
-}
+})
+
+# Smaller destination lists for individual sports
+HELI_SKIING_COUNTRIES = frozenset({
+    'Canada', 'United States', 'New Zealand', 'Switzerland', 'Austria',
+    'France', 'Italy', 'Chile', 'Argentina', 'Japan', 'Russia', 'Norway',
+    'Sweden', 'Iceland',
+})
+
+ZIPLINING_COUNTRIES = frozenset({
+    'Costa Rica', 'South Africa', 'New Zealand', 'Mexico', 'Peru', 'Ecuador',
+    'Colombia', 'Thailand', 'Philippines', 'Nepal',
+})
+
+JET_BOATING_COUNTRIES = frozenset({
+    'New Zealand', 'United States', 'Canada', 'Australia', 'Switzerland',
+    'United Kingdom',
+})
+
+WINGSUIT_COUNTRIES = frozenset({
+    'United States', 'Switzerland', 'France', 'Norway', 'Italy', 'Spain',
+    'China', 'United Arab Emirates', 'New Zealand', 'South Africa',
+})
+
+INDOOR_SKYDIVING_COUNTRIES = frozenset({
+    'United States', 'United Kingdom', 'France', 'Spain', 'Germany',
+    'Australia', 'China', 'United Arab Emirates', 'Japan', 'Singapore',
+    'Poland', 'Canada', 'Brazil', 'Thailand', 'Netherlands', 'Austria',
+    'Switzerland', 'Belgium', 'Czech Republic', 'Italy',
+})
 
 
 def is_landlocked(country: str) -> bool:
@@ -362,130 +399,143 @@ def is_landlocked(country: str) -> bool:
 
 def get_sport_availability(country: str) -> dict:
     """Determine which sports are available in a given country."""
-    landlocked = is_landlocked(country)
-    high_tourism = country in HIGH_TOURISM_COUNTRIES
+    columns = get_sport_availability_columns(pd.Series([country]))
+    return {sport: bool(available[0]) for sport, available in columns.items()}
+
+
+def get_sport_availability_columns(countries: pd.Series) -> dict:
+    """Determine sport availability for many countries at once.
+
+    The single source of the availability rules: each country set is
+    evaluated once for the whole column and the resulting boolean arrays
+    are combined. get_sport_availability is the one-country view of it.
+
+    Args:
+        countries: Country names
 
-    availability = {}
+    Returns:
+        Dict mapping each sport column to a NumPy bool array aligned with countries
+    """
+    # One Index over the names; isin on it returns plain bool arrays directly
+    names = pd.Index(countries)
+
+    def in_set(country_set):
+        return names.isin(country_set)
+
+    landlocked = in_set(LANDLOCKED)
+    coastal = ~landlocked
+    high_tourism = in_set(HIGH_TOURISM_COUNTRIES)
+    surf = in_set(SURFING_COUNTRIES)
+    kite = in_set(KITESURFING_COUNTRIES)
+    scuba = in_set(SCUBA_DIVING_COUNTRIES)
+    has_skiing = in_set(SKIING_COUNTRIES)
+    has_climbing = in_set(ROCK_CLIMBING_COUNTRIES)
+    has_rafting = in_set(WHITE_WATER_RAFTING_COUNTRIES)
+    paragliding = in_set(PARAGLIDING_COUNTRIES)
+    skydiving = in_set(SKYDIVING_COUNTRIES)
+
+    columns = {}
 
     # Water Sports - Coastal (only for non-landlocked)
-    availability['surfing'] = not landlocked and country in SURFING_COUNTRIES
-    availability['kitesurfing'] = not landlocked and country in KITESURFING_COUNTRIES
-    availability['windsurfing'] = not landlocked and country in KITESURFING_COUNTRIES  # Same as kitesurfing
-    availability['scuba_diving'] = not landlocked and country in SCUBA_DIVING_COUNTRIES
-    availability['snorkeling'] = not landlocked and country in SCUBA_DIVING_COUNTRIES
-    availability['sup'] = not landlocked and (high_tourism or country in SURFING_COUNTRIES)
-    availability['bodyboarding'] = not landlocked and country in SURFING_COUNTRIES
-    availability['jet_skiing'] = not landlocked and high_tourism
-    availability['wakeboarding'] = high_tourism or country in WHITE_WATER_RAFTING_COUNTRIES
-    availability['cliff_diving'] = not landlocked and country in ROCK_CLIMBING_COUNTRIES
+    columns['surfing'] = coastal & surf
+    columns['kitesurfing'] = coastal & kite
+    columns['windsurfing'] = coastal & kite  # Same as kitesurfing
+    columns['scuba_diving'] = coastal & scuba
+    columns['snorkeling'] = coastal & scuba
+    columns['sup'] = coastal & (high_tourism | surf)
+    columns['bodyboarding'] = coastal & surf
+    columns['jet_skiing'] = coastal & high_tourism
+    columns['wakeboarding'] = high_tourism | has_rafting
+    columns['cliff_diving'] = coastal & has_climbing
 
     # Snow/Winter Sports
-    has_skiing = country in SKIING_COUNTRIES
-    availability['skiing'] = has_skiing
-    availability['snowboarding'] = has_skiing
-    availability['freestyle_skiing'] = has_skiing and high_tourism
-    availability['backcountry_skiing'] = has_skiing
-    availability['ice_climbing'] = has_skiing and country in ROCK_CLIMBING_COUNTRIES
-    availability['snowmobiling'] = has_skiing and high_tourism
-    availability['xc_skiing'] = has_skiing
-    availability['heli_skiing'] = country in {'Canada', 'United States', 'New Zealand', 'Switzerland',
-                                               'Austria', 'France', 'Italy', 'Chile', 'Argentina',
-                                               'Japan', 'Russia', 'Norway', 'Sweden', 'Iceland'}
+    columns['skiing'] = has_skiing
+    columns['snowboarding'] = has_skiing
+    columns['freestyle_skiing'] = has_skiing & high_tourism
+    columns['backcountry_skiing'] = has_skiing
+    columns['ice_climbing'] = has_skiing & has_climbing
+    columns['snowmobiling'] = has_skiing & high_tourism
+    columns['xc_skiing'] = has_skiing
+    columns['heli_skiing'] = in_set(HELI_SKIING_COUNTRIES)
 
     # Mountain/Terrain Sports
-    has_climbing = country in ROCK_CLIMBING_COUNTRIES
-    availability['rock_climbing'] = has_climbing
-    availability['mountaineering'] = has_climbing and country in SKIING_COUNTRIES
-    availability['paragliding'] = country in PARAGLIDING_COUNTRIES
-    availability['hang_gliding'] = country in PARAGLIDING_COUNTRIES
-    availability['bungee_jumping'] = country in BUNGEE_JUMPING_COUNTRIES
-    availability['via_ferrata'] = has_climbing and country in SKIING_COUNTRIES
-    availability['canyoning'] = has_climbing and country in WHITE_WATER_RAFTING_COUNTRIES
-    availability['ziplining'] = high_tourism or country in {'Costa Rica', 'South Africa', 'New Zealand',
-                                                            'Mexico', 'Peru', 'Ecuador', 'Colombia',
-                                                            'Thailand', 'Philippines', 'Nepal'}
+    columns['rock_climbing'] = has_climbing
+    columns['mountaineering'] = has_climbing & has_skiing
+    columns['paragliding'] = paragliding
+    columns['hang_gliding'] = paragliding
+    columns['bungee_jumping'] = in_set(BUNGEE_JUMPING_COUNTRIES)
+    columns['via_ferrata'] = has_climbing & has_skiing
+    columns['canyoning'] = has_climbing & has_rafting
+    columns['ziplining'] = high_tourism | in_set(ZIPLINING_COUNTRIES)
 
     # River/Lake Sports
-    has_rafting = country in WHITE_WATER_RAFTING_COUNTRIES
-    availability['white_water_rafting'] = has_rafting
-    availability['kayaking'] = has_rafting or high_tourism
-    availability['canoeing'] = has_rafting or high_tourism
-    availability['jet_boating'] = country in {'New Zealand', 'United States', 'Canada', 'Australia',
-                                               'Switzerland', 'United Kingdom'}
-    availability['lake_wakeboarding'] = high_tourism
-    availability['water_skiing'] = high_tourism
-    availability['tubing'] = has_rafting or high_tourism
-    availability['flyboarding'] = high_tourism and not landlocked
+    columns['white_water_rafting'] = has_rafting
+    columns['kayaking'] = has_rafting | high_tourism
+    columns['canoeing'] = has_rafting | high_tourism
+    columns['jet_boating'] = in_set(JET_BOATING_COUNTRIES)
+    columns['lake_wakeboarding'] = high_tourism
+    columns['water_skiing'] = high_tourism
+    columns['tubing'] = has_rafting | high_tourism
+    columns['flyboarding'] = high_tourism & coastal
 
     # Universal Land Sports (most available in high tourism countries)
-    availability['skateboarding'] = high_tourism
-    availability['bmx'] = high_tourism
-    availability['mountain_biking'] = high_tourism or has_climbing
-    availability['motocross'] = high_tourism
-    availability['inline_skating'] = high_tourism
-    availability['parkour'] = high_tourism
-    availability['trail_running'] = high_tourism or has_climbing
-    availability['atv_quad'] = high_tourism
-    availability['go_karting'] = high_tourism
-    availability['obstacle_racing'] = high_tourism
+    columns['skateboarding'] = high_tourism
+    columns['bmx'] = high_tourism
+    columns['mountain_biking'] = high_tourism | has_climbing
+    columns['motocross'] = high_tourism
+    columns['inline_skating'] = high_tourism
+    columns['parkour'] = high_tourism
+    columns['trail_running'] = high_tourism | has_climbing
+    columns['atv_quad'] = high_tourism
+    columns['go_karting'] = high_tourism
+    columns['obstacle_racing'] = high_tourism
 
     # Air Sports
-    availability['skydiving'] = country in SKYDIVING_COUNTRIES
-    availability['base_jumping'] = country in SKYDIVING_COUNTRIES and has_climbing
-    availability['wingsuit'] = country in {'United States', 'Switzerland', 'France', 'Norway',
-                                            'Italy', 'Spain', 'China', 'United Arab Emirates',
-                                            'New Zealand', 'South Africa'}
-    availability['hot_air_ballooning'] = high_tourism
-    availability['powered_paragliding'] = country in PARAGLIDING_COUNTRIES
-    availability['indoor_skydiving'] = country in {'United States', 'United Kingdom', 'France',
-                                                    'Spain', 'Germany', 'Australia', 'China',
-                                                    'United Arab Emirates', 'Japan', 'Singapore',
-                                                    'Poland', 'Canada', 'Brazil', 'Thailand',
-                                                    'Netherlands', 'Austria', 'Switzerland',
-                                                    'Belgium', 'Czech Republic', 'Italy'}
-
-    return availability
+    columns['skydiving'] = skydiving
+    columns['base_jumping'] = skydiving & has_climbing
+    columns['wingsuit'] = in_set(WINGSUIT_COUNTRIES)
+    columns['hot_air_ballooning'] = high_tourism
+    columns['powered_paragliding'] = paragliding
+    columns['indoor_skydiving'] = in_set(INDOOR_SKYDIVING_COUNTRIES)
+
+    return columns
 
 
 def main():
     # Load the country data
-    data_dir = Path(__file__).parent.parent / 'data' / 'raw'
+    data_dir = project_root / 'data' / 'raw'
     countries_df = pd.read_csv(data_dir / 'joshua_project_countries.csv')
 
-    # Add parent directory to path for imports
-    import sys
-    sys.path.insert(0, str(Path(__file__).parent.parent))
-    from src.utils.country_codes import get_iso_alpha3
-
-    # Build the action sports data
-    rows = []
-    for _, row in countries_df.iterrows():
-        country = str(row['Country'])
-        iso_code = get_iso_alpha3(country)
+    # Build the action sports data, one vectorized column per sport
+    countries = countries_df['Country'].astype(str)
 
-        availability = get_sport_availability(country)
+    # Resolve each distinct name once, then map the whole column through the dict.
+    # Unknown codes stay null so the parquet reads back like the CSV (empty -> NaN).
+    iso_lookup = {country: get_iso_alpha3(country) for country in countries.unique()}
 
-        row_data = {
-            'country_name': country,
-            'iso_alpha_3': iso_code if iso_code else '',
-        }
-        row_data.update(availability)
-        rows.append(row_data)
+    # One DataFrame built from typed column arrays, no per-row records
+    df = pd.DataFrame({
+        'country_name': countries.to_numpy(),
+        'iso_alpha_3': countries.map(iso_lookup).to_numpy(),
+        **get_sport_availability_columns(countries),
+    })
 
-    # Create DataFrame
-    df = pd.DataFrame(rows)
+    # Save a CSV copy for reviewing changes plus the parquet read by the app.
+    # The parquet is written last: the loaders ignore a parquet older than its CSV.
+    csv_path = data_dir / 'action_sports_by_country.csv'
+    df.to_csv(csv_path, index=False, lineterminator='\n')
+    print(f"Created {csv_path}")
 
-    # Save to CSV
-    output_path = data_dir / 'action_sports_by_country.csv'
-    df.to_csv(output_path, index=False)
+    output_path = data_dir / 'action_sports_by_country.parquet'
+    df.to_parquet(output_path, index=False, compression='zstd')
     print(f"Created {output_path}")
     print(f"Total countries: {len(df)}")
     print(f"Columns: {len(df.columns)}")
 
     # Print some stats
     print("\nSport availability counts:")
-    for col in df.columns[2:]:  # Skip country_name and iso_alpha_3
-        count = df[col].sum()
+    counts = df.iloc[:, 2:].sum(axis=0)  # Skip country_name and iso_alpha_3
+    for col, count in counts.items():
         print(f"  {col}: {count} countries")
 
 
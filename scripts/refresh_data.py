@@ -16,6 +16,7 @@ sys.path.insert(0, str(project_root))
 from src.data.processors import merge_all_data
 from src.data.loaders import save_processed_data
 from src.scoring.combined import generate_rankings
+from scripts.convert_raw_to_parquet import main as convert_raw_to_parquet
 
 
 def main():
@@ -24,6 +25,10 @@ def main():
     print("Mission-Action Data Refresh")
     print("=" * 60)
 
+    # Keep the Parquet copies the loaders read in sync with the edited CSVs
+    print("\nConverting raw CSVs to Parquet...")
+    convert_raw_to_parquet()
+
     # Step 1: Merge all data sources
     print("\n[1/3] Merging data sources...")
     merged_df = merge_all_data()
@@ -53,10 +58,12 @@ def main():
     print("\nTop 10 Combined Rankings:")
     print("-" * 40)
 
-    top_10 = rankings_df.nsmallest(10, 'combined_rank')
-    for i, (_, row) in enumerate(top_10.iterrows(), 1):
-        name = row.get('country_name', row.get('Country', 'Unknown'))
-        score = row.get('combined_score', 0)
+    name_col = 'country_name' if 'country_name' in rankings_df.columns else 'Country'
+    top_10 = (
+        rankings_df.nsmallest(10, 'combined_rank')[[name_col, 'combined_score']]
+        .fillna({name_col: 'Unknown', 'combined_score': 0.0})
+    )
+    for i, (name, score) in enumerate(top_10.itertuples(index=False), 1):
         print(f"  {i:2d}. {name:25s} {score:.1f}")
 
     return 0
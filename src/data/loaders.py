@@ -1,16 +1,86 @@
 """Data loading functions with Streamlit caching."""
 
+import orjson
 import streamlit as st
 import pandas as pd
 from pathlib import Path
 from typing import Optional
 
 
-# Get the data directory path
-DATA_DIR = Path(__file__).parent.parent.parent / "data"
+# Get the data directory path (resolved once at import)
+DATA_DIR = Path(__file__).resolve().parent.parent.parent / "data"
+
+# Data file paths
+JOSHUA_PROJECT_PATH = DATA_DIR / "raw" / "joshua_project_countries.csv"
+OPEN_DOORS_PATH = DATA_DIR / "raw" / "open_doors_wwl_2025.csv"
+WEF_TTDI_PATH = DATA_DIR / "raw" / "wef_ttdi_2024.csv"
+ACTION_SPORTS_CSV_PATH = DATA_DIR / "raw" / "action_sports_by_country.csv"
+PROCESSED_DIR = DATA_DIR / "processed"
+COMBINED_RANKINGS_PATH = PROCESSED_DIR / "combined_rankings.parquet"
+GEOJSON_PATH = DATA_DIR / "geojson" / "countries.geojson"
+
+
+def _read_raw_table(csv_path: Path, dtype: Optional[dict] = None) -> Optional[pd.DataFrame]:
+    """Read a raw input table, preferring an up-to-date Parquet sibling.
+
+    The Parquet copies are written by scripts/convert_raw_to_parquet.py and
+    come back already typed, so no text parsing or dtype inference is needed.
+    The CSV is the source of truth: a Parquet copy older than its CSV is
+    stale (the CSV was edited without re-running the converter) and ignored.
+
+    Args:
+        csv_path: Path to the raw CSV file
+        dtype: Optional column dtypes to apply to either source
+
+    Returns:
+        DataFrame, or None if neither file exists
+    """
+    parquet_path = csv_path.with_suffix('.parquet')
+    if parquet_path.exists() and (
+        not csv_path.exists()
+        or parquet_path.stat().st_mtime >= csv_path.stat().st_mtime
+    ):
+        df = pd.read_parquet(parquet_path, engine='pyarrow')
+        return df.astype(dtype) if dtype else df
+
+    if not csv_path.exists():
+        return None
+
+    return pd.read_csv(csv_path, engine='pyarrow', dtype=dtype)
+
+
+def _source_version(csv_path: Path) -> tuple:
+    """Fingerprint a raw input and its Parquet sibling for cache keys.
+
+    The cached loaders are keyed on their arguments, so passing this in makes
+    a data-only change (edited CSV, git pull) invalidate the entry.
+
+    Args:
+        csv_path: Path to the raw CSV file
+
+    Returns:
+        Tuple of (name, mtime_ns, size) for each file that exists
+    """
+    version = []
+    for path in (csv_path, csv_path.with_suffix('.parquet')):
+        if path.exists():
+            stat = path.stat()
+            version.append((path.name, stat.st_mtime_ns, stat.st_size))
+    return tuple(version)
+
+
+def raw_data_version() -> tuple:
+    """Fingerprint every raw input, for caches built from all of them.
+
+    Returns:
+        Tuple of the per-source fingerprints from _source_version
+    """
+    return tuple(
+        _source_version(path)
+        for path in (JOSHUA_PROJECT_PATH, OPEN_DOORS_PATH, WEF_TTDI_PATH, ACTION_SPORTS_CSV_PATH)
+    )
 
 
-@st.cache_data(ttl=3600)
 def load_joshua_project_data() -> pd.DataFrame:
     """Load Joshua Project country-level religious data.
 
@@ -19,54 +89,81 @@ def load_joshua_project_data() -> pd.DataFrame:
         Percent Evangelical, Percent Christian Adherent, Percent Unreached,
         Primary Religion, Unreached People Groups
     """
-    file_path = DATA_DIR / "raw" / "joshua_project_countries.csv"
+    return _load_joshua_project_data(_source_version(JOSHUA_PROJECT_PATH))
 
-    if not file_path.exists():
+
+@st.cache_data
+def _load_joshua_project_data(source_version: tuple) -> pd.DataFrame:
+    """Read the Joshua Project table; ``source_version`` keys the cache."""
+    file_path = JOSHUA_PROJECT_PATH
+
+    df = _read_raw_table(file_path)
+    if df is None:
         st.error(f"Joshua Project data not found at {file_path}")
         return pd.DataFrame()
 
-    df = pd.read_csv(file_path)
-
-    # Convert percentage strings to floats
+    # Convert percentage strings to floats; Parquet and the Arrow parser already type
+    # clean numeric columns, so only columns read as text need coercing.
+    # Strip '%' suffixes in one vectorized pass so '12.3%' is kept, not NaN.
     pct_columns = ['Percent Evangelical', 'Percent Christian Adherent', 'Percent Unreached']
     for col in pct_columns:
+        if col in df.columns and not pd.api.types.is_numeric_dtype(df[col]):
+            values = df[col].astype(str).str.strip().str.rstrip('%')
+            df[col] = pd.to_numeric(values, errors='coerce')
+
+    # Percentages carry one decimal place, so float32 holds them at half the size
+    pct_present = [col for col in pct_columns if col in df.columns]
+    df[pct_present] = df[pct_present].astype('float32')
+
+    # Few distinct values repeated across rows: store as categorical codes
+    for col in ('Continent', 'Primary Religion'):
         if col in df.columns:
-            df[col] = pd.to_numeric(df[col], errors='coerce')
+            df[col] = df[col].astype('category')
 
     return df
 
 
-@st.cache_data(ttl=3600)
 def load_open_doors_data() -> pd.DataFrame:
     """Load Open Doors World Watch List persecution data.
 
     Returns:
         DataFrame with columns: rank, country, persecution_score
     """
-    file_path = DATA_DIR / "raw" / "open_doors_wwl_2025.csv"
+    return _load_open_doors_data(_source_version(OPEN_DOORS_PATH))
 
-    if not file_path.exists():
+
+@st.cache_data
+def _load_open_doors_data(source_version: tuple) -> pd.DataFrame:
+    """Read the Open Doors table; ``source_version`` keys the cache."""
+    file_path = OPEN_DOORS_PATH
+
+    df = _read_raw_table(file_path, dtype={'persecution_score': 'float32'})
+    if df is None:
         st.error(f"Open Doors data not found at {file_path}")
         return pd.DataFrame()
 
-    df = pd.read_csv(file_path)
     return df
 
 
-@st.cache_data(ttl=3600)
 def load_wef_ttdi_data() -> pd.DataFrame:
     """Load WEF Travel & Tourism Development Index data.
 
     Returns:
         DataFrame with columns: Rank, Country, ISO_Code, Overall_TTDI_Score
     """
-    file_path = DATA_DIR / "raw" / "wef_ttdi_2024.csv"
+    return _load_wef_ttdi_data(_source_version(WEF_TTDI_PATH))
 
-    if not file_path.exists():
+
+@st.cache_data
+def _load_wef_ttdi_data(source_version: tuple) -> pd.DataFrame:
+    """Read the WEF TTDI table; ``source_version`` keys the cache."""
+    file_path = WEF_TTDI_PATH
+
+    df = _read_raw_table(file_path, dtype={'Overall_TTDI_Score': 'float32'})
+    if df is None:
         st.error(f"WEF TTDI data not found at {file_path}")
         return pd.DataFrame()
 
-    df = pd.read_csv(file_path)
     return df
 
 
@@ -77,41 +174,106 @@ def load_processed_data() -> Optional[pd.DataFrame]:
     Returns:
         DataFrame with all scores and rankings, or None if not found
     """
-    file_path = DATA_DIR / "processed" / "combined_rankings.parquet"
+    file_path = COMBINED_RANKINGS_PATH
 
     if not file_path.exists():
         return None
 
-    return pd.read_parquet(file_path)
+    df = pd.read_parquet(file_path)
 
+    # Files written before the raw loader made these categorical hold plain
+    # strings; store the few distinct values as categorical codes either way
+    for col in ('continent', 'primary_religion'):
+        if col in df.columns and not isinstance(df[col].dtype, pd.CategoricalDtype):
+            df[col] = df[col].astype('category')
 
-@st.cache_data
+    return df
+
+
+# Decimal places kept for GeoJSON coordinates (~1 m precision)
+GEOJSON_COORD_PRECISION = 5
+
+
+def _round_coordinates(coords, precision: int = GEOJSON_COORD_PRECISION):
+    """Recursively round nested GeoJSON coordinate arrays.
+
+    Args:
+        coords: Coordinate pair or (nested) list of coordinate pairs
+        precision: Number of decimal places to keep
+
+    Returns:
+        Coordinates with the same nesting, rounded to ``precision``
+    """
+    if coords and isinstance(coords[0], (int, float)):
+        return [round(c, precision) for c in coords]
+    return [_round_coordinates(c, precision) for c in coords]
+
+
+def simplify_geojson(geojson: dict, precision: int = GEOJSON_COORD_PRECISION) -> dict:
+    """Reduce coordinate precision of a GeoJSON FeatureCollection.
+
+    Full-precision source files carry ~15 decimal places per coordinate,
+    far more than a world map can display. Trimming them shrinks the
+    payload Plotly serializes to the browser.
+
+    Args:
+        geojson: GeoJSON FeatureCollection dictionary
+        precision: Number of decimal places to keep
+
+    Returns:
+        GeoJSON dictionary with rounded coordinates
+    """
+    for feature in geojson.get('features', []):
+        geometry = feature.get('geometry')
+        if geometry and 'coordinates' in geometry:
+            geometry['coordinates'] = _round_coordinates(geometry['coordinates'], precision)
+    return geojson
+
+
+@st.cache_resource
 def load_geojson() -> dict:
     """Load world countries GeoJSON for choropleth maps.
 
+    Coordinates are rounded to ``GEOJSON_COORD_PRECISION`` decimals. The
+    dict is cached as a shared resource rather than copied per call, so
+    callers must not modify it.
+
     Returns:
         GeoJSON dictionary
     """
-    import json
-
-    file_path = DATA_DIR / "geojson" / "countries.geojson"
+    file_path = GEOJSON_PATH
 
     if not file_path.exists():
-        # Fall back to natural earth data via URL
-        import requests
-        url = "https://raw.githubusercontent.com/datasets/geo-countries/master/data/countries.geojson"
-        response = requests.get(url, timeout=30)
-        response.raise_for_status()
+        return _download_geojson()
+
+    return simplify_geojson(orjson.loads(file_path.read_bytes()))
+
+
+def _download_geojson() -> dict:
+    """Download world countries GeoJSON and save a simplified copy.
+
+    Only used when ``GEOJSON_PATH`` is missing. The saved copy is what a
+    restarted process reads, so the download happens once per checkout.
+
+    Returns:
+        GeoJSON dictionary
+    """
+    import requests
+
+    # Fall back to natural earth data via URL
+    url = "https://raw.githubusercontent.com/datasets/geo-countries/master/data/countries.geojson"
+    response = requests.get(url, timeout=30)
+    response.raise_for_status()
 
-        # Save for future use
-        file_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(file_path, 'w') as f:
-            f.write(response.text)
+    # Parse the raw bytes directly instead of decoding them to text first
+    geojson = simplify_geojson(orjson.loads(response.content))
 
-        return response.json()
+    # Save the simplified geometry for future use
+    file_path = GEOJSON_PATH
+    file_path.parent.mkdir(parents=True, exist_ok=True)
+    file_path.write_bytes(orjson.dumps(geojson))
 
-    with open(file_path, 'r') as f:
-        return json.load(f)
+    return geojson
 
 
 def save_processed_data(df: pd.DataFrame, filename: str = "combined_rankings.parquet") -> None:
@@ -121,24 +283,43 @@ def save_processed_data(df: pd.DataFrame, filename: str = "combined_rankings.par
         df: DataFrame to save
         filename: Output filename
     """
-    output_path = DATA_DIR / "processed" / filename
+    output_path = PROCESSED_DIR / filename
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    df.to_parquet(output_path, index=False)
+    # pyarrow dictionary-encodes repeated strings (countries, continents) by default
+    df.to_parquet(
+        output_path,
+        index=False,
+        engine='pyarrow',
+        compression='zstd',
+        compression_level=3,
+        use_dictionary=True,
+    )
 
 
-@st.cache_data(ttl=3600)
 def load_action_sports_data() -> pd.DataFrame:
     """Load action sports availability by country.
 
+    Prefers the parquet file written by scripts/generate_action_sports_data.py,
+    which stores the sport flags as booleans, and falls back to the CSV copy.
+
     Returns:
         DataFrame with columns: country_name, iso_alpha_3, plus 50 boolean sport columns
     """
-    file_path = DATA_DIR / "raw" / "action_sports_by_country.csv"
+    return _load_action_sports_data(_source_version(ACTION_SPORTS_CSV_PATH))
 
-    if not file_path.exists():
+
+@st.cache_data
+def _load_action_sports_data(source_version: tuple) -> pd.DataFrame:
+    """Read the action sports table; ``source_version`` keys the cache."""
+    # Declare the sport flags as bool so the CSV fallback skips type inference
+    df = _read_raw_table(
+        ACTION_SPORTS_CSV_PATH,
+        dtype={col: 'bool' for col in ACTION_SPORTS_MAPPING.values()},
+    )
+    if df is None:
         return pd.DataFrame()
 
-    return pd.read_csv(file_path)
+    return df
 
 
 # Mapping from display names to column names for action sports
@@ -195,6 +376,9 @@ ACTION_SPORTS_MAPPING = {
     'Indoor Skydiving': 'indoor_skydiving',
 }
 
+# Display names in alphabetical order, sorted once at import
+ACTION_SPORTS_SORTED = tuple(sorted(ACTION_SPORTS_MAPPING))
+
 
 def get_action_sports_list() -> list:
     """Get list of all action sports display names for filter dropdown.
@@ -202,7 +386,7 @@ def get_action_sports_list() -> list:
     Returns:
         List of action sport display names in alphabetical order
     """
-    return sorted(ACTION_SPORTS_MAPPING.keys())
+    return list(ACTION_SPORTS_SORTED)
 
 
 def sport_display_to_column(display_name: str) -> str:
@@ -214,4 +398,8 @@ def sport_display_to_column(display_name: str) -> str:
     Returns:
         Column name in the data (e.g., 'scuba_diving')
     """
-    return ACTION_SPORTS_MAPPING.get(display_name, display_name.lower().replace(' ', '_'))
+    column = ACTION_SPORTS_MAPPING.get(display_name)
+    if column is None:
+        # Only derive a column name for names missing from the mapping
+        column = display_name.lower().replace(' ', '_')
+    return column
@@ -12,6 +12,51 @@ from src.data.loaders import (
     load_action_sports_data,
 )
 
+# Columns of each lookup source that are merged into the Joshua Project base
+OPEN_DOORS_COLUMNS = ['iso_alpha_3', 'persecution_score', 'persecution_rank']
+WEF_TTDI_COLUMNS = ['iso_alpha_3', 'ttdi_score', 'ttdi_rank']
+
+
+def _map_unique(values: pd.Series, func) -> pd.Series:
+    """Apply a per-name lookup once per distinct value and map the result.
+
+    Country names repeat across rows and lookups go through pycountry, so
+    resolving the unique names into a dict and mapping the column replaces
+    a Python call per row with a hash probe per row.
+
+    Args:
+        values: Series of country names
+        func: Lookup such as get_iso_alpha3 or standardize_country_name
+
+    Returns:
+        Series of lookup results aligned with values
+    """
+    lookup = {value: func(value) for value in values.dropna().unique()}
+    return values.map(lookup)
+
+
+def _drop_duplicate_keys(df: pd.DataFrame, name_col: str) -> pd.DataFrame:
+    """Keep one row per ISO code so left merges on it cannot multiply rows.
+
+    Several source names can resolve to the same code (an alias next to the
+    official name); the row whose source name already equals its
+    standardized name wins, otherwise the first row. Rows without a code
+    are left alone. Only used on the lookup sources, never on the base, so
+    no country is dropped from the rankings.
+
+    Args:
+        df: Processed DataFrame with iso_alpha_3 and country_name columns
+        name_col: Column holding the source country name
+
+    Returns:
+        DataFrame in the original row order with duplicate codes removed
+    """
+    preferred = df[name_col].eq(df['country_name']).to_numpy()
+    ordered = df.iloc[np.argsort(~preferred, kind='stable')]
+
+    duplicate = ordered['iso_alpha_3'].notna() & ordered.duplicated('iso_alpha_3')
+    return ordered[~duplicate].sort_index()
+
 
 def process_joshua_project_data(df: Optional[pd.DataFrame] = None) -> pd.DataFrame:
     """Process Joshua Project data, adding ISO codes and cleaning.
@@ -29,10 +74,10 @@ def process_joshua_project_data(df: Optional[pd.DataFrame] = None) -> pd.DataFra
         return df
 
     # Add ISO codes
-    df['iso_alpha_3'] = df['Country'].apply(get_iso_alpha3)
+    df['iso_alpha_3'] = _map_unique(df['Country'], get_iso_alpha3)
 
     # Standardize country names
-    df['country_name'] = df['Country'].apply(standardize_country_name)
+    df['country_name'] = _map_unique(df['Country'], standardize_country_name)
 
     # Handle missing evangelical percentages (marked as 0.0 but unknown)
     # Keep as is - they are already numeric
@@ -58,7 +103,7 @@ def process_open_doors_data(df: Optional[pd.DataFrame] = None) -> pd.DataFrame:
         df: Optional pre-loaded DataFrame, loads if None
 
     Returns:
-        Processed DataFrame with ISO codes
+        Processed DataFrame with OPEN_DOORS_COLUMNS, one row per ISO code
     """
     if df is None:
         df = load_open_doors_data()
@@ -67,10 +112,10 @@ def process_open_doors_data(df: Optional[pd.DataFrame] = None) -> pd.DataFrame:
         return df
 
     # Add ISO codes
-    df['iso_alpha_3'] = df['country'].apply(get_iso_alpha3)
+    df['iso_alpha_3'] = _map_unique(df['country'], get_iso_alpha3)
 
     # Standardize country names
-    df['country_name'] = df['country'].apply(standardize_country_name)
+    df['country_name'] = _map_unique(df['country'], standardize_country_name)
 
     # Rename columns for consistency
     df = df.rename(columns={
@@ -78,7 +123,9 @@ def process_open_doors_data(df: Optional[pd.DataFrame] = None) -> pd.DataFrame:
         'rank': 'persecution_rank',
     })
 
-    return df
+    # Only rows with an ISO code can be merged; keep just the merged columns
+    df = _drop_duplicate_keys(df, 'country')
+    return df.loc[df['iso_alpha_3'].notna(), OPEN_DOORS_COLUMNS]
 
 
 def process_wef_ttdi_data(df: Optional[pd.DataFrame] = None) -> pd.DataFrame:
@@ -88,7 +135,7 @@ def process_wef_ttdi_data(df: Optional[pd.DataFrame] = None) -> pd.DataFrame:
         df: Optional pre-loaded DataFrame, loads if None
 
     Returns:
-        Processed DataFrame with standardized columns
+        Processed DataFrame with WEF_TTDI_COLUMNS, one row per ISO code
     """
     if df is None:
         df = load_wef_ttdi_data()
@@ -98,10 +145,10 @@ def process_wef_ttdi_data(df: Optional[pd.DataFrame] = None) -> pd.DataFrame:
 
     # Add ISO codes if not present
     if 'iso_alpha_3' not in df.columns:
-        df['iso_alpha_3'] = df['Country'].apply(get_iso_alpha3)
+        df['iso_alpha_3'] = _map_unique(df['Country'], get_iso_alpha3)
 
     # Standardize country names
-    df['country_name'] = df['Country'].apply(standardize_country_name)
+    df['country_name'] = _map_unique(df['Country'], standardize_country_name)
 
     # Rename columns for consistency
     df = df.rename(columns={
@@ -110,7 +157,9 @@ def process_wef_ttdi_data(df: Optional[pd.DataFrame] = None) -> pd.DataFrame:
         'ISO_Code': 'iso_code_original',
     })
 
-    return df
+    # Only rows with an ISO code can be merged; keep just the merged columns
+    df = _drop_duplicate_keys(df, 'Country')
+    return df.loc[df['iso_alpha_3'].notna(), WEF_TTDI_COLUMNS]
 
 
 def merge_all_data() -> pd.DataFrame:
@@ -124,25 +173,23 @@ def merge_all_data() -> pd.DataFrame:
     open_doors_df = process_open_doors_data()
     wef_df = process_wef_ttdi_data()
 
-    # Start with Joshua Project as base (most complete country list)
-    merged = joshua_df.copy()
+    # Start with Joshua Project as base (most complete country list).
+    # Each merge returns a new frame, so neither the base nor the column
+    # subsets need a defensive copy.
+    merged = joshua_df
 
-    # Merge Open Doors data
+    # Merge Open Doors data (already reduced to keyed, unique rows)
     if not open_doors_df.empty:
-        open_doors_cols = ['iso_alpha_3', 'persecution_score', 'persecution_rank']
-        open_doors_subset = open_doors_df[open_doors_cols].copy()
         merged = merged.merge(
-            open_doors_subset,
+            open_doors_df,
             on='iso_alpha_3',
             how='left'
         )
 
     # Merge WEF TTDI data
     if not wef_df.empty:
-        wef_cols = ['iso_alpha_3', 'ttdi_score', 'ttdi_rank']
-        wef_subset = wef_df[wef_cols].copy()
         merged = merged.merge(
-            wef_subset,
+            wef_df,
             on='iso_alpha_3',
             how='left'
         )
@@ -156,7 +203,7 @@ def merge_all_data() -> pd.DataFrame:
     merged['legal_openness'] = 100 - merged['persecution_score']
 
     # Fill missing TTDI scores with median
-    if 'ttdi_score' in merged.columns:
+    if 'ttdi_score' in merged.columns and merged['ttdi_score'].hasnans:
         median_ttdi = merged['ttdi_score'].median()
         merged['ttdi_score'] = merged['ttdi_score'].fillna(median_ttdi)
 
@@ -184,20 +231,23 @@ def merge_action_sports(df: pd.DataFrame) -> pd.DataFrame:
     sport_columns = [col for col in action_sports_df.columns
                      if col not in ['country_name', 'iso_alpha_3']]
 
-    # Select only necessary columns for merge
-    action_sports_subset = action_sports_df[['iso_alpha_3'] + sport_columns].copy()
+    # Rows without an ISO code cannot match, and duplicate codes would
+    # multiply the base rows. The sports table is keyed by the raw Joshua
+    # Project name, so prefer rows for names still present in the base.
+    keyed = action_sports_df[action_sports_df['iso_alpha_3'].notna()]
+    if 'Country' in df.columns:
+        keyed = keyed[keyed['country_name'].isin(df['Country'])]
+    keyed = keyed.drop_duplicates('iso_alpha_3')
 
-    # Merge on ISO code
+    # Merge on ISO code, selecting only the necessary columns
     merged = df.merge(
-        action_sports_subset,
+        keyed[['iso_alpha_3'] + sport_columns],
         on='iso_alpha_3',
         how='left'
     )
 
-    # Fill any missing sport values with False
-    for col in sport_columns:
-        if col in merged.columns:
-            merged[col] = merged[col].fillna(False).astype(bool)
+    # Fill any missing sport values with False in one block operation
+    merged[sport_columns] = merged[sport_columns].fillna(False).astype(bool)
 
     return merged
 
@@ -215,13 +265,15 @@ def calculate_religious_need_score(df: pd.DataFrame) -> pd.Series:
     """
     # Combine % non-Christian with % unreached
     # More weight on unreached groups as they indicate active need
-    pct_non_christian = 100 - df['pct_christian'].fillna(50)
-    pct_unreached = df['pct_unreached'].fillna(50)
+    pct_christian = np.nan_to_num(df['pct_christian'].to_numpy(), nan=50)
+    pct_unreached = np.nan_to_num(df['pct_unreached'].to_numpy(), nan=50)
 
     # Weighted combination: 60% unreached, 40% non-Christian
-    need_score = (0.6 * pct_unreached) + (0.4 * pct_non_christian)
+    need_score = 0.6 * pct_unreached
+    need_score += 0.4 * (100 - pct_christian)
+    np.clip(need_score, 0, 100, out=need_score)
 
-    return need_score.clip(0, 100)
+    return pd.Series(need_score, index=df.index)
 
 
 def calculate_missionary_gap_score(df: pd.DataFrame) -> pd.Series:
@@ -237,23 +289,28 @@ def calculate_missionary_gap_score(df: pd.DataFrame) -> pd.Series:
     """
     # Use unreached people groups as primary indicator
     # Normalize by population to get per-capita measure
-    unreached = df['unreached_groups'].fillna(0)
-    population = df['population'].fillna(1)
+    unreached = np.nan_to_num(df['unreached_groups'].to_numpy(), nan=0)
+    population = np.nan_to_num(df['population'].to_numpy(), nan=1)
 
     # Unreached groups per million population
-    unreached_per_million = (unreached / population) * 1_000_000
+    unreached_per_million = unreached / population
+    unreached_per_million *= 1_000_000
 
-    # Also factor in low evangelical presence
-    low_evangelical = 100 - (df['pct_evangelical'].fillna(0) * 10)  # Scale 0-10% to 0-100
+    # Also factor in low evangelical presence, scaling 0-10% to 0-100
+    low_evangelical = 100 - np.nan_to_num(df['pct_evangelical'].to_numpy(), nan=0) * 10
+    np.clip(low_evangelical, 0, 100, out=low_evangelical)
 
-    # Normalize unreached_per_million to 0-100
-    max_upm = unreached_per_million.max()
+    # Normalize unreached_per_million to 0-100 (the buffer is reused in place)
+    max_upm = np.nanmax(unreached_per_million) if len(df) else 0
     if max_upm > 0:
-        unreached_normalized = (unreached_per_million / max_upm) * 100
+        unreached_per_million /= max_upm
+        unreached_per_million *= 100
     else:
-        unreached_normalized = pd.Series([0] * len(df))
+        unreached_per_million[:] = 0
 
     # Combine: 50% unreached groups, 50% low evangelical
-    gap_score = (0.5 * unreached_normalized) + (0.5 * low_evangelical.clip(0, 100))
+    gap_score = 0.5 * unreached_per_million
+    gap_score += 0.5 * low_evangelical
+    np.clip(gap_score, 0, 100, out=gap_score)
 
-    return gap_score.clip(0, 100)
+    return pd.Series(gap_score, index=df.index)
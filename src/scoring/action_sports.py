@@ -1,5 +1,6 @@
 """Action Sports Score calculator based on adventure tourism metrics."""
 
+import numpy as np
 import pandas as pd
 from dataclasses import dataclass
 
@@ -53,14 +54,26 @@ class ActionSportsScorer:
         """
         if 'ttdi_score' not in df.columns:
             # Return default middle score if no TTDI data
-            return pd.Series([50.0] * len(df), index=df.index)
+            return pd.Series(np.full(len(df), 50.0), index=df.index)
 
-        # TTDI scores are typically 1-6 scale
-        # Normalize to 0-100 scale
-        ttdi = df['ttdi_score'].fillna(df['ttdi_score'].median())
+        return self._normalized_ttdi(df)
 
-        # Normalize using actual min/max from data
-        action_score = min_max_normalize(
+    def _normalized_ttdi(self, df: pd.DataFrame) -> pd.Series:
+        """Normalize TTDI scores (1-6 scale) to 0-100, filling gaps with the median.
+
+        Args:
+            df: DataFrame with ttdi_score column
+
+        Returns:
+            Series with normalized TTDI scores (0-100)
+        """
+        ttdi = df['ttdi_score']
+        if ttdi.hasnans:
+            # Merged data is already median-filled, so this rarely runs
+            ttdi = ttdi.fillna(ttdi.median())
+
+        # Normalize using the TTDI theoretical range
+        return min_max_normalize(
             ttdi,
             min_val=1.0,  # TTDI theoretical minimum
             max_val=6.0,  # TTDI theoretical maximum
@@ -68,8 +81,6 @@ class ActionSportsScorer:
             target_max=100
         )
 
-        return action_score
-
     def get_component_breakdown(self, df: pd.DataFrame) -> pd.DataFrame:
         """Get detailed component breakdown for each country.
 
@@ -83,15 +94,11 @@ class ActionSportsScorer:
 
         if 'ttdi_score' in df.columns:
             breakdown['ttdi_raw'] = df['ttdi_score']
-            breakdown['ttdi_normalized'] = min_max_normalize(
-                df['ttdi_score'].fillna(df['ttdi_score'].median()),
-                min_val=1.0,
-                max_val=6.0,
-                target_min=0,
-                target_max=100
-            )
-
-        breakdown['action_sports_score'] = self.calculate(df)
+            # TTDI is the only component, so the normalized value is the score
+            breakdown['ttdi_normalized'] = self._normalized_ttdi(df)
+            breakdown['action_sports_score'] = breakdown['ttdi_normalized']
+        else:
+            breakdown['action_sports_score'] = self.calculate(df)
 
         return breakdown
 
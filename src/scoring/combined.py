@@ -1,12 +1,20 @@
 """Combined ranking logic for Action Sports and Outreach scores."""
 
+import streamlit as st
 import pandas as pd
 import numpy as np
 
 from src.scoring.action_sports import ActionSportsScorer, calculate_action_sports_score
 from src.scoring.outreach import OutreachScorer, calculate_outreach_score
 from src.data.processors import merge_all_data
-from src.data.loaders import save_processed_data
+from src.data.loaders import load_processed_data, raw_data_version, save_processed_data
+from src.utils.normalization import rank_descending
+
+
+# Keys the disk-cached rankings. Streamlit only hashes _build_rankings' own
+# source, so bump this whenever merge_all_data, generate_rankings or the
+# scorers change their output, or old pickled rankings keep being served.
+RANKINGS_SCHEMA_VERSION = 3
 
 
 def calculate_combined_score(
@@ -28,9 +36,15 @@ def calculate_combined_score(
         Combined scores (0-100)
     """
     if method == "multiply":
-        # Multiply and scale back to 0-100
-        # (A * B) / 100 where A,B are 0-100
-        combined = (action_score * outreach_score) / 100
+        # Multiply and scale back to 0-100: (A * B) / 100 where A,B are 0-100.
+        # Default path, so it runs in place in one NumPy buffer.
+        combined = np.multiply(
+            action_score.to_numpy(dtype=np.float64),
+            outreach_score.to_numpy(dtype=np.float64),
+        )
+        combined /= 100
+        np.clip(combined, 0, 100, out=combined)
+        return pd.Series(combined, index=action_score.index)
     elif method == "average":
         combined = (action_score + outreach_score) / 2
     elif method == "geometric_mean":
@@ -50,36 +64,33 @@ def generate_rankings(df: pd.DataFrame) -> pd.DataFrame:
     Returns:
         DataFrame with scores and rankings
     """
-    result = df.copy()
-
     # Calculate individual scores
-    result['action_sports_score'] = calculate_action_sports_score(result)
-    result['outreach_score'] = calculate_outreach_score(result)
+    scores = {
+        'action_sports_score': calculate_action_sports_score(df),
+        'outreach_score': calculate_outreach_score(df),
+    }
 
     # Calculate combined score
-    result['combined_score'] = calculate_combined_score(
-        result['action_sports_score'],
-        result['outreach_score'],
+    scores['combined_score'] = calculate_combined_score(
+        scores['action_sports_score'],
+        scores['outreach_score'],
         method="multiply"
     )
 
     # Generate rankings (higher score = better rank = lower number)
-    result['action_sports_rank'] = result['action_sports_score'].rank(
-        ascending=False, method='min'
-    ).astype(int)
-
-    result['outreach_rank'] = result['outreach_score'].rank(
-        ascending=False, method='min'
-    ).astype(int)
-
-    result['combined_rank'] = result['combined_score'].rank(
-        ascending=False, method='min'
-    ).astype(int)
+    ranks = {
+        score_col.replace('_score', '_rank'): rank_descending(score)
+        for score_col, score in scores.items()
+    }
 
-    # Round scores to 1 decimal place
-    result['action_sports_score'] = result['action_sports_score'].round(1)
-    result['outreach_score'] = result['outreach_score'].round(1)
-    result['combined_score'] = result['combined_score'].round(1)
+    # Round scores to 1 decimal place in float64 (float32 inputs would keep
+    # 81.8 as 81.800003), then attach all new columns in one assign instead
+    # of copying df up front (df itself is not modified)
+    rounded = {
+        score_col: score.astype(np.float64).round(1)
+        for score_col, score in scores.items()
+    }
+    result = df.assign(**rounded, **ranks)
 
     # Sort by combined rank
     result = result.sort_values('combined_rank')
@@ -105,24 +116,57 @@ def get_component_breakdowns(df: pd.DataFrame) -> dict:
     }
 
 
+def build_rankings() -> pd.DataFrame:
+    """Merge all data sources and generate complete rankings.
+
+    Cached to disk per ``RANKINGS_SCHEMA_VERSION`` and raw data fingerprint,
+    so the merge and scoring pipeline reruns when either changes.
+
+    Returns:
+        DataFrame with complete rankings
+    """
+    return _build_rankings(RANKINGS_SCHEMA_VERSION, raw_data_version())
+
+
+@st.cache_data(persist="disk")
+def _build_rankings(schema_version: int, source_version: tuple) -> pd.DataFrame:
+    """Run the merge and scoring pipeline; both arguments key the disk cache."""
+    return generate_rankings(merge_all_data())
+
+
 def build_and_save_rankings() -> pd.DataFrame:
     """Build complete rankings and save to processed data.
 
     Returns:
         DataFrame with complete rankings
     """
-    # Merge all data sources
-    merged_df = merge_all_data()
+    rankings = build_rankings()
 
-    # Generate rankings
-    rankings = generate_rankings(merged_df)
+    # Ranks stay below a few hundred, so int16 shrinks the saved file and the
+    # loaded frame. Scores stay float64: float32 would save 81.8 as 81.800003.
+    rankings = rankings.astype({
+        f'{score_type}_rank': 'int16'
+        for score_type in ('action_sports', 'outreach', 'combined')
+    })
 
-    # Save to processed directory
+    # Save to processed directory (kept outside the cache so it always runs)
     save_processed_data(rankings, "combined_rankings.parquet")
 
     return rankings
 
 
+def get_rankings() -> pd.DataFrame:
+    """Get complete rankings, preferring the saved processed data.
+
+    Returns:
+        DataFrame with complete rankings
+    """
+    rankings = load_processed_data()
+    if rankings is None:
+        rankings = build_and_save_rankings()
+    return rankings
+
+
 def get_top_countries(
     df: pd.DataFrame,
     score_type: str = "combined",
@@ -156,17 +200,18 @@ def get_country_details(df: pd.DataFrame, country_name: str) -> dict:
     Returns:
         Dict with country details and scores
     """
-    # Find country row
-    country_row = df[df['country_name'] == country_name]
+    # Find the first matching row position without building a filtered frame
+    positions = np.flatnonzero(df['country_name'].to_numpy() == country_name)
 
-    if country_row.empty:
+    if not positions.size and 'Country' in df.columns:
         # Try matching on original Country column
-        country_row = df[df['Country'] == country_name]
+        positions = np.flatnonzero(df['Country'].to_numpy() == country_name)
 
-    if country_row.empty:
+    if not positions.size:
         return None
 
-    row = country_row.iloc[0]
+    # One conversion to a plain dict; the lookups below are dict hits
+    row = df.iloc[positions[0]].to_dict()
 
     return {
         'name': row.get('country_name', row.get('Country', country_name)),
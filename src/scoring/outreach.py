@@ -1,5 +1,6 @@
 """Christian Outreach Opportunity Score calculator."""
 
+import numpy as np
 import pandas as pd
 from dataclasses import dataclass
 
@@ -23,6 +24,22 @@ class OutreachWeights:
         return abs(total - 1.0) < 0.01
 
 
+def _legal_openness(df: pd.DataFrame) -> pd.Series:
+    """Legal openness (inverse of persecution), before clipping.
+
+    Args:
+        df: DataFrame with legal_openness or persecution_score column
+
+    Returns:
+        Series with legal openness scores
+    """
+    if 'legal_openness' in df.columns:
+        return df['legal_openness'].fillna(100)  # Default to fully open
+    if 'persecution_score' in df.columns:
+        return 100 - df['persecution_score'].fillna(0)
+    return pd.Series(np.full(len(df), 100.0), index=df.index)
+
+
 class OutreachScorer:
     """Calculate Christian Outreach Opportunity Score for countries.
 
@@ -44,38 +61,28 @@ class OutreachScorer:
         """
         self.weights = weights or OutreachWeights()
 
-    def calculate(self, df: pd.DataFrame) -> pd.Series:
-        """Calculate Outreach Score for all countries.
+    def _compute_components(self, df: pd.DataFrame) -> tuple:
+        """Compute the three component scores, each clipped to 0-100.
 
         Args:
-            df: DataFrame with required columns:
-                - pct_christian
-                - pct_unreached
-                - unreached_groups
-                - pct_evangelical
-                - legal_openness (or persecution_score)
+            df: DataFrame with the columns required by calculate()
 
         Returns:
-            Series with Outreach Scores (0-100)
+            Tuple of (religious_need, missionary_gap, legal_openness) Series
         """
-        # Calculate component scores
         religious_need = calculate_religious_need_score(df)
         missionary_gap = calculate_missionary_gap_score(df)
-
-        # Legal openness (inverse of persecution)
-        if 'legal_openness' in df.columns:
-            legal_openness = df['legal_openness'].fillna(100)  # Default to fully open
-        elif 'persecution_score' in df.columns:
-            legal_openness = 100 - df['persecution_score'].fillna(0)
-        else:
-            legal_openness = pd.Series([100.0] * len(df), index=df.index)
+        legal_openness = _legal_openness(df)
 
         # Ensure all scores are 0-100
-        religious_need = religious_need.clip(0, 100)
-        missionary_gap = missionary_gap.clip(0, 100)
-        legal_openness = legal_openness.clip(0, 100)
+        return (
+            religious_need.clip(0, 100),
+            missionary_gap.clip(0, 100),
+            legal_openness.clip(0, 100),
+        )
 
-        # Calculate weighted score
+    def _weighted_score(self, religious_need, missionary_gap, legal_openness) -> pd.Series:
+        """Combine component scores with the configured weights."""
         outreach_score = (
             self.weights.religious_need * religious_need +
             self.weights.missionary_gap * missionary_gap +
@@ -84,6 +91,22 @@ class OutreachScorer:
 
         return outreach_score.clip(0, 100)
 
+    def calculate(self, df: pd.DataFrame) -> pd.Series:
+        """Calculate Outreach Score for all countries.
+
+        Args:
+            df: DataFrame with required columns:
+                - pct_christian
+                - pct_unreached
+                - unreached_groups
+                - pct_evangelical
+                - legal_openness (or persecution_score)
+
+        Returns:
+            Series with Outreach Scores (0-100)
+        """
+        return self._weighted_score(*self._compute_components(df))
+
     def get_component_breakdown(self, df: pd.DataFrame) -> pd.DataFrame:
         """Get detailed component breakdown for each country.
 
@@ -93,19 +116,16 @@ class OutreachScorer:
         Returns:
             DataFrame with component scores
         """
-        breakdown = pd.DataFrame(index=df.index)
+        components = self._compute_components(df)
+        religious_need, missionary_gap, legal_openness = components
 
-        breakdown['religious_need'] = calculate_religious_need_score(df)
-        breakdown['missionary_gap'] = calculate_missionary_gap_score(df)
-
-        if 'legal_openness' in df.columns:
-            breakdown['legal_openness'] = df['legal_openness'].fillna(100)
-        elif 'persecution_score' in df.columns:
-            breakdown['legal_openness'] = 100 - df['persecution_score'].fillna(0)
-        else:
-            breakdown['legal_openness'] = 100.0
+        breakdown = pd.DataFrame(index=df.index)
+        breakdown['religious_need'] = religious_need
+        breakdown['missionary_gap'] = missionary_gap
+        breakdown['legal_openness'] = legal_openness
 
-        breakdown['outreach_score'] = self.calculate(df)
+        # Reuse the components rather than recomputing them via calculate()
+        breakdown['outreach_score'] = self._weighted_score(*components)
 
         return breakdown
 
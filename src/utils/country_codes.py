@@ -1,6 +1,8 @@
 """Country code utilities for standardizing country names and ISO codes."""
 
 import pycountry
+from functools import lru_cache
+from sys import intern
 from typing import Optional
 
 
@@ -55,7 +57,37 @@ COUNTRY_NAME_MAPPINGS = {
     "Aruba": "Aruba",
 }
 
+# Codes for places pycountry does not list. Without an entry the fuzzy search
+# resolves them to a neighbour's code (Kosovo -> SRB) and they collide with it.
+ISO_CODE_OVERRIDES = {
+    "Kosovo": "XKX",  # User-assigned code used by the EU and IMF
+}
+
+
+def _build_name_index() -> dict:
+    """Map every pycountry name variant to its alpha-3 code.
+
+    Covers ``name``, ``official_name`` and ``common_name``, each also in a
+    stripped lowercase form, so exact lookups skip pycountry's searches.
+
+    Returns:
+        Dict mapping name variants to alpha-3 codes
+    """
+    index = {}
+    for country in pycountry.countries:
+        for attr in ('name', 'official_name', 'common_name'):
+            value = getattr(country, attr, None)
+            if value:
+                index.setdefault(value, country.alpha_3)
+                index.setdefault(value.strip().lower(), country.alpha_3)
+    return index
+
+
+# Name variant -> alpha-3 code, built once at import
+_NAME_TO_ISO3 = _build_name_index()
 
+
+@lru_cache(maxsize=4096)
 def get_iso_alpha3(country_name: str) -> Optional[str]:
     """Get ISO 3166-1 alpha-3 code for a country name.
 
@@ -68,11 +100,20 @@ def get_iso_alpha3(country_name: str) -> Optional[str]:
     if not country_name:
         return None
 
+    # Codes pycountry does not know about
+    if country_name in ISO_CODE_OVERRIDES:
+        return ISO_CODE_OVERRIDES[country_name]
+
     # Check manual mappings first
     mapped_name = COUNTRY_NAME_MAPPINGS.get(country_name, country_name)
     if mapped_name is None:
         return None
 
+    # Exact or case-insensitive match against the prebuilt name index
+    iso = _NAME_TO_ISO3.get(mapped_name) or _NAME_TO_ISO3.get(mapped_name.strip().lower())
+    if iso:
+        return iso
+
     # Try direct lookup
     try:
         country = pycountry.countries.get(name=mapped_name)
@@ -100,6 +141,7 @@ def get_iso_alpha3(country_name: str) -> Optional[str]:
     return None
 
 
+@lru_cache(maxsize=4096)
 def get_country_name(iso_code: str) -> Optional[str]:
     """Get standard country name from ISO code.
 
@@ -126,8 +168,8 @@ def get_country_name(iso_code: str) -> Optional[str]:
     return None
 
 
-def standardize_country_name(country_name: str) -> str:
-    """Standardize a country name to a consistent format.
+def _standardize(country_name: str) -> str:
+    """Resolve a country name to its standard form via ISO code lookup.
 
     Args:
         country_name: Input country name
@@ -135,9 +177,6 @@ def standardize_country_name(country_name: str) -> str:
     Returns:
         Standardized country name
     """
-    if not country_name:
-        return country_name
-
     # Check manual mappings
     if country_name in COUNTRY_NAME_MAPPINGS:
         mapped = COUNTRY_NAME_MAPPINGS[country_name]
@@ -154,23 +193,59 @@ def standardize_country_name(country_name: str) -> str:
     return country_name
 
 
+# Standardized names for every manual-mapping key and pycountry name,
+# resolved once at import so known inputs are a single dict lookup
+_STANDARD_TABLE = {
+    name: _standardize(name)
+    for name in (
+        *COUNTRY_NAME_MAPPINGS,
+        *(country.name for country in pycountry.countries),
+        *(getattr(country, 'common_name', country.name) for country in pycountry.countries),
+    )
+}
+
+
+@lru_cache(maxsize=4096)
+def standardize_country_name(country_name: str) -> str:
+    """Standardize a country name to a consistent format.
+
+    Args:
+        country_name: Input country name
+
+    Returns:
+        Standardized country name
+    """
+    if not country_name:
+        return country_name
+
+    standard_name = _STANDARD_TABLE.get(country_name)
+    if standard_name is not None:
+        return standard_name
+
+    return _standardize(country_name)
+
+
 def get_all_country_codes() -> dict:
     """Get a dictionary mapping country names to ISO codes.
 
     Returns:
         Dict mapping country names to alpha-3 codes
     """
+    # Keys and codes are interned so repeated strings share one object
     codes = {}
     for country in pycountry.countries:
-        name = getattr(country, 'common_name', country.name)
-        codes[name] = country.alpha_3
-        codes[country.name] = country.alpha_3
+        alpha_3 = intern(country.alpha_3)
+        codes[intern(getattr(country, 'common_name', country.name))] = alpha_3
+        codes[intern(country.name)] = alpha_3
 
-    # Add manual mappings
+    # Add manual mappings; most targets are pycountry names already in codes
     for name, mapped in COUNTRY_NAME_MAPPINGS.items():
         if mapped:
-            iso = get_iso_alpha3(mapped)
+            iso = codes.get(mapped) or get_iso_alpha3(mapped)
             if iso:
-                codes[name] = iso
+                codes[intern(name)] = intern(iso)
+
+    for name, iso in ISO_CODE_OVERRIDES.items():
+        codes[intern(name)] = intern(iso)
 
     return codes
@@ -26,29 +26,113 @@ def min_max_normalize(
     Returns:
         Normalized pandas Series
     """
-    series = pd.Series(values)
+    # Work on one NumPy buffer; only the final result is wrapped in a Series
+    index = values.index if isinstance(values, pd.Series) else None
+    arr = np.asarray(values)
+    if not np.issubdtype(arr.dtype, np.floating):
+        arr = arr.astype(np.float64)
 
     if min_val is None:
-        min_val = series.min()
+        min_val = np.nanmin(arr) if arr.size else np.nan
     if max_val is None:
-        max_val = series.max()
+        max_val = np.nanmax(arr) if arr.size else np.nan
 
     # Avoid division by zero
     if max_val == min_val:
-        return pd.Series([target_max] * len(series))
+        return pd.Series(np.full(len(arr), target_max, dtype=np.float64), index=index)
 
-    # Normalize to 0-1 range
-    normalized = (series - min_val) / (max_val - min_val)
+    # Normalize to 0-1 range (np.subtract allocates the output buffer)
+    scaled = np.subtract(arr, min_val)
+    scaled /= (max_val - min_val)
 
     # Invert if requested
     if invert:
-        normalized = 1 - normalized
+        np.subtract(1, scaled, out=scaled)
 
     # Scale to target range
-    scaled = normalized * (target_max - target_min) + target_min
+    scaled *= (target_max - target_min)
+    scaled += target_min
 
     # Clip to target range
-    return scaled.clip(target_min, target_max)
+    np.clip(scaled, target_min, target_max, out=scaled)
+    return pd.Series(scaled, index=index)
+
+
+def batch_min_max_normalize(
+    values: np.ndarray,
+    axis: int = 0,
+    target_min: float = 0,
+    target_max: float = 100,
+    invert: bool = False
+) -> np.ndarray:
+    """Min-max normalize every slice of a 2-D array in one vectorized pass.
+
+    Each slice along ``axis`` (each column for the default ``axis=0``) is
+    scaled exactly as ``min_max_normalize`` would scale it on its own.
+
+    Args:
+        values: 2-D array of scores
+        axis: Axis along which min and max are taken
+        target_min: Target minimum value (default 0)
+        target_max: Target maximum value (default 100)
+        invert: If True, invert the scale (high becomes low)
+
+    Returns:
+        Normalized array with the same shape as values
+    """
+    arr = np.asarray(values)
+    if not np.issubdtype(arr.dtype, np.floating):
+        arr = arr.astype(np.float64)
+    if arr.size == 0:
+        return arr.copy()
+
+    mn = np.nanmin(arr, axis=axis, keepdims=True)
+    mx = np.nanmax(arr, axis=axis, keepdims=True)
+
+    # Constant slices get target_max, like min_max_normalize
+    constant = mx == mn
+    span = np.where(constant, 1, mx - mn)
+
+    scaled = np.subtract(arr, mn)
+    scaled /= span
+
+    if invert:
+        np.subtract(1, scaled, out=scaled)
+
+    scaled *= (target_max - target_min)
+    scaled += target_min
+    np.clip(scaled, target_min, target_max, out=scaled)
+
+    scaled[np.broadcast_to(constant, scaled.shape)] = target_max
+    return scaled
+
+
+def min_max_normalize_columns(
+    df: pd.DataFrame,
+    columns: list,
+    target_min: float = 0,
+    target_max: float = 100,
+    invert: bool = False
+) -> pd.DataFrame:
+    """Min-max normalize several DataFrame columns in one call.
+
+    Args:
+        df: DataFrame holding the columns
+        columns: Columns to normalize independently
+        target_min: Target minimum value (default 0)
+        target_max: Target maximum value (default 100)
+        invert: If True, invert the scale (high becomes low)
+
+    Returns:
+        DataFrame of the normalized columns with df's index
+    """
+    normalized = batch_min_max_normalize(
+        df[columns].to_numpy(dtype=np.float64, na_value=np.nan),
+        target_min=target_min,
+        target_max=target_max,
+        invert=invert,
+    )
+    return pd.DataFrame(normalized, index=df.index, columns=columns)
 
 
 def percentile_normalize(
@@ -92,21 +176,26 @@ def z_score_normalize(
     Returns:
         Normalized pandas Series
     """
-    series = pd.Series(values)
+    # Same NaN-skipping statistics as pandas (sample std, ddof=1), in NumPy
+    index = values.index if isinstance(values, pd.Series) else None
+    arr = np.asarray(values, dtype=np.float64)
 
-    mean = series.mean()
-    std = series.std()
+    valid = arr[~np.isnan(arr)]
+    mean = valid.mean() if valid.size else np.nan
+    std = valid.std(ddof=1) if valid.size > 1 else np.nan
 
     if std == 0:
-        return pd.Series([target_mean] * len(series))
+        return pd.Series(np.full(len(arr), target_mean, dtype=np.float64), index=index)
 
-    # Calculate z-scores
-    z_scores = (series - mean) / std
+    # Calculate z-scores in one buffer
+    normalized = np.subtract(arr, mean)
+    normalized /= std
 
     # Transform to target distribution
-    normalized = z_scores * target_std + target_mean
+    normalized *= target_std
+    normalized += target_mean
 
-    return normalized
+    return pd.Series(normalized, index=index)
 
 
 def combine_weighted_scores(
@@ -130,17 +219,24 @@ def combine_weighted_scores(
         # Normalize weights
         weights = {k: v / total_weight for k, v in weights.items()}
 
-    # Calculate weighted sum
-    combined = pd.Series(0.0, index=next(iter(scores.values())).index)
-
-    for name, series in scores.items():
-        weight = weights.get(name, 0)
-        combined = combined + (series * weight)
-
+    # Calculate weighted sum as one matrix-vector product over the stacked
+    # scores (all series share the index of the first one)
+    names = list(scores)
+    weight_vec = np.fromiter(
+        (weights.get(name, 0) for name in names), dtype=np.float64, count=len(names)
+    )
+    matrix = np.column_stack([
+        np.asarray(scores[name], dtype=np.float64) for name in names
+    ])
+    combined = matrix @ weight_vec
+
+    # Stay on the ndarray; the only Series is built at return
     if normalize_output:
-        combined = min_max_normalize(combined, target_min=0, target_max=100)
+        combined = batch_min_max_normalize(
+            combined[:, np.newaxis], target_min=0, target_max=100
+        )[:, 0]
 
-    return combined
+    return pd.Series(combined, index=scores[names[0]].index)
 
 
 def calculate_combined_score(
@@ -158,14 +254,61 @@ def calculate_combined_score(
     Returns:
         Combined score as pandas Series (0-100)
     """
+    if method not in ("multiply", "average", "geometric_mean"):
+        raise ValueError(f"Unknown method: {method}")
+
+    a = np.asarray(score_a, dtype=np.float64)
+    b = np.asarray(score_b, dtype=np.float64)
+    combined = np.empty_like(a)
+
+    # Every method fills the one output buffer in place
     if method == "multiply":
         # Multiply and scale back to 0-100
-        combined = (score_a * score_b) / 100
+        np.multiply(a, b, out=combined)
+        combined /= 100
     elif method == "average":
-        combined = (score_a + score_b) / 2
-    elif method == "geometric_mean":
-        combined = np.sqrt(score_a * score_b)
+        np.add(a, b, out=combined)
+        combined /= 2
     else:
-        raise ValueError(f"Unknown method: {method}")
+        np.multiply(a, b, out=combined)
+        np.sqrt(combined, out=combined)
+
+    np.clip(combined, 0, 100, out=combined)
+    return pd.Series(combined, index=getattr(score_a, 'index', None))
+
+
+def rank_descending(values: Union[pd.Series, np.ndarray, list]) -> np.ndarray:
+    """Rank values from highest to lowest, giving ties the minimum rank.
+
+    Equivalent to ``Series.rank(ascending=False, method='min')`` for
+    NaN-free input, computed with a single argsort, without pandas' ranking
+    overhead. NaN has no integer rank, so it is rejected.
+
+    Args:
+        values: Input values to rank
+
+    Returns:
+        Integer NumPy array of 1-based ranks (1 = highest value)
+
+    Raises:
+        ValueError: If any value is NaN
+    """
+    arr = np.asarray(values, dtype=np.float64)
+    n = arr.size
+
+    if np.isnan(arr).any():
+        raise ValueError("Cannot rank NaN values")
+
+    order = np.argsort(-arr, kind='stable')
+    sorted_vals = arr[order]
+
+    # Each run of tied values takes the position of its first member
+    is_new = np.empty(n, dtype=bool)
+    is_new[:1] = True
+    is_new[1:] = sorted_vals[1:] != sorted_vals[:-1]
+    positions = np.arange(1, n + 1, dtype=np.int32)
+    run_start = np.maximum.accumulate(np.where(is_new, positions, 0))
 
-    return combined.clip(0, 100)
+    ranks = np.empty(n, dtype=np.int32)
+    ranks[order] = run_start
+    return ranks
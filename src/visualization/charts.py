@@ -2,10 +2,35 @@
 
 import plotly.express as px
 import plotly.graph_objects as go
+import plotly.io as pio
+import numpy as np
 import pandas as pd
 from typing import Dict, List, Optional
 
 
+# Shared layout pieces; Plotly copies these on assignment, so they are never mutated
+CHART_MARGIN = dict(l=20, r=20, t=40, b=20)
+QUADRANT_LINE_STYLE = dict(line_dash="dash", line_color="gray", opacity=0.5)
+
+# Shared look for the 0-100 score bar charts, registered once so each factory
+# references it by name instead of re-validating the same layout keys
+CHART_TEMPLATE = 'mission'
+_chart_template = go.layout.Template(pio.templates['plotly'])
+_chart_template.layout.update(
+    margin=CHART_MARGIN,
+    yaxis_range=[0, 100],
+    showlegend=False,
+)
+pio.templates[CHART_TEMPLATE] = _chart_template
+
+# Bar colors for the score breakdown chart
+SCORE_COLORS = {
+    'Action Sports': '#1f77b4',
+    'Outreach': '#ff7f0e',
+    'Combined': '#2ca02c',
+}
+
+
 def create_score_breakdown_chart(
     country_details: Dict,
     chart_type: str = 'bar'
@@ -29,7 +54,7 @@ def create_score_breakdown_chart(
     ]
 
     if chart_type == 'radar':
-        fig = go.Figure()
+        fig = go.Figure(layout_template=CHART_TEMPLATE)
         fig.add_trace(go.Scatterpolar(
             r=values + [values[0]],  # Close the polygon
             theta=categories + [categories[0]],
@@ -43,35 +68,57 @@ def create_score_breakdown_chart(
                     range=[0, 100]
                 )
             ),
-            showlegend=False,
         )
     else:  # bar
         fig = px.bar(
             x=categories,
             y=values,
             color=categories,
-            color_discrete_map={
-                'Action Sports': '#1f77b4',
-                'Outreach': '#ff7f0e',
-                'Combined': '#2ca02c',
-            },
-        )
-        fig.update_layout(
-            yaxis_range=[0, 100],
-            showlegend=False,
-            xaxis_title='',
-            yaxis_title='Score',
+            color_discrete_map=SCORE_COLORS,
+            template=CHART_TEMPLATE,
         )
+        fig.update_layout(xaxis_title='', yaxis_title='Score')
 
     fig.update_layout(
         title=f"Scores for {country_details.get('name', 'Selected Country')}",
         height=300,
-        margin=dict(l=20, r=20, t=40, b=20),
     )
 
     return fig
 
 
+def _compute_outreach_components(components) -> np.ndarray:
+    """Approximate outreach component scores for one or many countries.
+
+    Args:
+        components: Components dict for one country, or a DataFrame with
+            one row per country; missing fields use the chart defaults
+
+    Returns:
+        Array of shape (n, 3) with religious need, missionary gap and
+        legal openness per row, clipped to 0-100
+    """
+    pct_christian, pct_unreached, pct_evangelical, legal_openness = np.broadcast_arrays(*(
+        np.atleast_1d(np.asarray(components.get(field, default), dtype=np.float64))
+        for field, default in (
+            ('pct_christian', 50),
+            ('pct_unreached', 50),
+            ('pct_evangelical', 0),
+            ('legal_openness', 100),
+        )
+    ))
+
+    stacked = np.column_stack([
+        # Religious need: inverse of Christian percentage
+        0.6 * pct_unreached + 0.4 * (100 - pct_christian),
+        # Missionary gap: low evangelical presence (simplified)
+        100 - pct_evangelical * 10,
+        legal_openness,
+    ])
+    np.clip(stacked, 0, 100, out=stacked)
+    return stacked
+
+
 def create_component_breakdown_chart(
     country_details: Dict,
     score_type: str = 'outreach'
@@ -95,23 +142,7 @@ def create_component_breakdown_chart(
             'Legal Openness',
         ]
         # Calculate approximate component values
-        pct_christian = components.get('pct_christian', 50)
-        pct_unreached = components.get('pct_unreached', 50)
-        legal_openness = components.get('legal_openness', 100)
-
-        # Religious need: inverse of Christian percentage
-        religious_need = (0.6 * pct_unreached) + (0.4 * (100 - pct_christian))
-
-        # Missionary gap: based on unreached groups and low evangelical
-        unreached = components.get('unreached_groups', 0)
-        pct_evangelical = components.get('pct_evangelical', 0)
-        missionary_gap = 100 - (pct_evangelical * 10)  # Simplified
-
-        values = [
-            min(100, max(0, religious_need)),
-            min(100, max(0, missionary_gap)),
-            min(100, max(0, legal_openness)),
-        ]
+        values = _compute_outreach_components(components)[0].tolist()
     else:
         # Action sports - just TTDI for now
         ttdi = components.get('ttdi_score', 3.5)
@@ -125,15 +156,14 @@ def create_component_breakdown_chart(
         x=categories,
         y=values,
         color_discrete_sequence=['#636efa'],
+        template=CHART_TEMPLATE,
     )
 
     fig.update_layout(
-        yaxis_range=[0, 100],
         xaxis_title='',
         yaxis_title='Score',
         title=f"{score_type.replace('_', ' ').title()} Components",
         height=250,
-        margin=dict(l=20, r=20, t=40, b=20),
     )
 
     return fig
@@ -154,15 +184,14 @@ def create_comparison_chart(
     Returns:
         Plotly Figure object
     """
-    # Filter to selected countries
+    # Filter to selected countries, keeping only the two plotted columns
     name_col = 'country_name' if 'country_name' in df.columns else 'Country'
-    compare_df = df[df[name_col].isin(countries)].copy()
+    score_col = f'{score_type}_score'
+    compare_df = df.loc[df[name_col].isin(countries), [name_col, score_col]]
 
     if compare_df.empty:
         return go.Figure()
 
-    score_col = f'{score_type}_score'
-
     fig = px.bar(
         compare_df,
         x=name_col,
@@ -203,22 +232,21 @@ def create_scatter_plot(
     """
     name_col = 'country_name' if 'country_name' in df.columns else 'Country'
 
-    # Build arguments
-    scatter_args = {
-        'x': x_score,
-        'y': y_score,
-        'hover_name': name_col,
-        'title': 'Action Sports vs Outreach Opportunity',
-    }
-
-    if size_col and size_col in df.columns:
-        scatter_args['size'] = size_col
-        scatter_args['size_max'] = 40
+    # Optional columns resolve to None, which Plotly treats as omitted
+    use_size = bool(size_col) and size_col in df.columns
+    use_color = bool(color_col) and color_col in df.columns
 
-    if color_col and color_col in df.columns:
-        scatter_args['color'] = color_col
-
-    fig = px.scatter(df, **scatter_args)
+    fig = px.scatter(
+        df,
+        x=x_score,
+        y=y_score,
+        hover_name=name_col,
+        title='Action Sports vs Outreach Opportunity',
+        render_mode='webgl',  # Draw points on the GPU instead of as SVG nodes
+        size=size_col if use_size else None,
+        size_max=40,  # Only applies when size is set
+        color=color_col if use_color else None,
+    )
 
     fig.update_layout(
         xaxis_title='Action Sports Score',
@@ -226,11 +254,13 @@ def create_scatter_plot(
         xaxis_range=[0, 105],
         yaxis_range=[0, 105],
         height=500,
+        transition_duration=0,
+        uirevision='constant',  # Keep pan/zoom across reruns
     )
 
     # Add quadrant lines
-    fig.add_hline(y=50, line_dash="dash", line_color="gray", opacity=0.5)
-    fig.add_vline(x=50, line_dash="dash", line_color="gray", opacity=0.5)
+    fig.add_hline(y=50, **QUADRANT_LINE_STYLE)
+    fig.add_vline(x=50, **QUADRANT_LINE_STYLE)
 
     return fig
 
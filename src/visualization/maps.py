@@ -2,6 +2,7 @@
 
 import plotly.express as px
 import plotly.graph_objects as go
+import plotly.io as pio
 import pandas as pd
 import numpy as np
 from typing import Optional
@@ -14,9 +15,42 @@ SCORE_TITLES = {
     'outreach': 'Christian Outreach Opportunity Score',
 }
 
+# Titles by score type, extended with derived titles for other types on first use
+_title_cache = dict(SCORE_TITLES)
+
 # Number of top countries to show on the map
 TOP_N_COUNTRIES = 100
 
+# Shared map layout; Plotly copies these on assignment, so they are never mutated
+GEO_LAYOUT = dict(
+    showframe=False,
+    showcoastlines=True,
+    coastlinecolor='lightgray',
+    showland=True,
+    landcolor='#e8e8e8',  # Light gray for unranked countries
+    showocean=True,
+    oceancolor='lightblue',
+    projection_type='natural earth',
+    resolution=110,  # Coarsest built-in geometry keeps the payload small
+    bgcolor='rgba(0,0,0,0)',
+)
+MAP_MARGIN = dict(l=0, r=0, t=40, b=0)
+
+# Default template extended with the map layout, registered once so each
+# choropleth references it by name instead of re-validating GEO_LAYOUT
+MAP_TEMPLATE = 'mission_map'
+_map_template = go.layout.Template(pio.templates['plotly'])
+_map_template.layout.update(geo=GEO_LAYOUT, margin=MAP_MARGIN)
+pio.templates[MAP_TEMPLATE] = _map_template
+
+
+def _score_title(score_type: str) -> str:
+    """Return the map title for a score type, deriving and caching unknown ones."""
+    title = _title_cache.get(score_type)
+    if title is None:
+        title = _title_cache[score_type] = f'{score_type.title()} Score'
+    return title
+
 
 def create_choropleth(
     df: pd.DataFrame,
@@ -46,31 +80,61 @@ def create_choropleth(
     if score_col not in df.columns:
         raise ValueError(f"Score column '{score_col}' not found in DataFrame")
 
-    # Prepare data for display
-    plot_df = df.copy()
-
     # Get country names for display
-    if 'country_name' in plot_df.columns:
+    if 'country_name' in df.columns:
         name_col = 'country_name'
-    elif 'Country' in plot_df.columns:
+    elif 'Country' in df.columns:
         name_col = 'Country'
     else:
         name_col = 'iso_alpha_3'
 
+    # Prepare data for display: copy only the columns the figure uses
+    # rather than the whole (possibly wide) frame
+    plot_cols = ['iso_alpha_3', name_col, score_col]
+    if rank_col in df.columns:
+        plot_cols.append(rank_col)
+    plot_df = df[list(dict.fromkeys(plot_cols))].copy()
+
+    return _build_choropleth(plot_df, score_type, name_col, height, show_colorbar, top_n)
+
+
+def _build_choropleth(
+    plot_df: pd.DataFrame,
+    score_type: str,
+    name_col: str,
+    height: int,
+    show_colorbar: bool,
+    top_n: int,
+) -> go.Figure:
+    """Build the choropleth Figure for create_choropleth.
+
+    Args:
+        plot_df: Copy of the plotted columns (display_score is added to it)
+        score_type: Type of score to display
+        name_col: Column used for hover names
+        height: Height of the figure in pixels
+        show_colorbar: Whether to show the color bar
+        top_n: Number of top-ranked countries to display with colors
+
+    Returns:
+        Plotly Figure object
+    """
+    score_col = f"{score_type}_score"
+    rank_col = f"{score_type}_rank"
+
     # Filter to top N countries for coloring
     if rank_col in plot_df.columns:
         # Countries ranked within top N get their actual score
         # Countries outside top N get NaN (will appear gray)
-        plot_df['display_score'] = plot_df.apply(
-            lambda row: row[score_col] if row[rank_col] <= top_n else np.nan,
-            axis=1
-        )
+        in_top_n = plot_df[rank_col].to_numpy() <= top_n
+        scores = plot_df[score_col].to_numpy()
+        plot_df['display_score'] = np.where(in_top_n, scores.astype(np.float64), np.nan)
 
         # Calculate min/max from top N countries only
-        top_n_df = plot_df[plot_df[rank_col] <= top_n]
-        if not top_n_df.empty:
-            score_min = top_n_df[score_col].min()
-            score_max = top_n_df[score_col].max()
+        top_scores = scores[in_top_n]
+        if top_scores.size:
+            score_min = np.nanmin(top_scores)
+            score_max = np.nanmax(top_scores)
         else:
             score_min, score_max = 0, 100
     else:
@@ -97,25 +161,16 @@ def create_choropleth(
         hover_name=name_col,
         hover_data=hover_data,
         color_continuous_scale='RdYlBu_r',  # Red-Yellow-Blue reversed (blue=low, red=high)
-        title=SCORE_TITLES.get(score_type, f'{score_type.title()} Score'),
+        title=_score_title(score_type),
         labels={score_col: 'Score', rank_col: 'Rank', 'display_score': 'Score'},
+        template=MAP_TEMPLATE,
     )
 
     # Update layout
     fig.update_layout(
-        geo=dict(
-            showframe=False,
-            showcoastlines=True,
-            coastlinecolor='lightgray',
-            showland=True,
-            landcolor='#e8e8e8',  # Light gray for unranked countries
-            showocean=True,
-            oceancolor='lightblue',
-            projection_type='natural earth',
-            bgcolor='rgba(0,0,0,0)',
-        ),
         height=height,
-        margin=dict(l=0, r=0, t=40, b=0),
+        transition_duration=0,
+        uirevision='constant',  # Keep pan/zoom across reruns
         coloraxis_colorbar=dict(
             title=f'Score<br>(Top {top_n})',
             tickmode='auto',
@@ -1,28 +1,36 @@
 """Rankings table visualization components."""
 
+import numpy as np
 import streamlit as st
 import pandas as pd
-from typing import List, Optional
+from functools import lru_cache
+from typing import List, Optional, Tuple
 
 
-def create_rankings_table(
+# Name columns the search box matches against, in order of preference
+_NAME_COLS = ('country_name', 'Country')
+
+# Shorter search queries match nearly every country, so they are ignored
+MIN_SEARCH_LENGTH = 2
+
+
+def plan_rankings_view(
     df: pd.DataFrame,
     score_type: str = 'combined',
     columns: List[str] = None,
-    height: int = 400,
     search_term: str = None,
-) -> pd.DataFrame:
-    """Create a formatted rankings table for display.
+) -> Tuple[List[str], np.ndarray]:
+    """Work out which columns and rows the rankings table shows, without copying.
 
     Args:
         df: DataFrame with rankings data
         score_type: Which ranking to sort by
         columns: Columns to display (uses defaults if None)
-        height: Height of the table in pixels
-        search_term: Optional search term to filter countries
+        search_term: Optional search term to filter countries; terms shorter
+            than MIN_SEARCH_LENGTH are ignored
 
     Returns:
-        Filtered and formatted DataFrame
+        Tuple of (display columns, row positions in display order)
     """
     if columns is None:
         columns = [
@@ -34,32 +42,88 @@ def create_rankings_table(
             'combined_score',
         ]
 
-    # Filter to existing columns
-    available_cols = [c for c in columns if c in df.columns]
+    # Filter to existing columns; the defaults name the selected score
+    # twice, so drop repeats (pyarrow rejects duplicate column names)
+    available_cols = [c for c in dict.fromkeys(columns) if c in df.columns]
 
     if not available_cols:
         # Fallback to basic columns
         available_cols = ['Country', 'combined_score', 'combined_rank']
         available_cols = [c for c in available_cols if c in df.columns]
 
-    display_df = df[available_cols].copy()
-
     # Apply search filter
-    if search_term:
-        name_col = 'country_name' if 'country_name' in display_df.columns else 'Country'
-        if name_col in display_df.columns:
-            display_df = display_df[
-                display_df[name_col].str.lower().str.contains(
-                    search_term.lower(), na=False
-                )
-            ]
+    rows = np.arange(len(df))
+    if search_term and len(search_term.strip()) >= MIN_SEARCH_LENGTH:
+        name_col = next((c for c in _NAME_COLS if c in available_cols), None)
+        if name_col == 'country_name' and '_name_lower' in df.columns:
+            # Reuse the names lowercased once at load (see app.load_base_data)
+            mask = df['_name_lower'].str.contains(
+                search_term.lower(), regex=False, na=False
+            )
+            rows = np.flatnonzero(mask.to_numpy())
+        elif name_col is not None:
+            # One case-insensitive substring scan; no lowercased copy or regex
+            mask = df[name_col].str.contains(
+                search_term, case=False, regex=False, na=False
+            )
+            rows = np.flatnonzero(mask.to_numpy())
 
     # Sort by rank
     rank_col = f'{score_type}_rank'
-    if rank_col in display_df.columns:
-        display_df = display_df.sort_values(rank_col)
+    if rank_col in available_cols:
+        # Frames pre-sorted by this rank (see _sorted_view) need no sort
+        if not df[rank_col].is_monotonic_increasing:
+            ranks = df[rank_col].to_numpy()[rows]
+            rows = rows[np.argsort(ranks, kind='stable')]
+
+    return available_cols, rows
+
+
+def create_rankings_table(
+    df: pd.DataFrame,
+    score_type: str = 'combined',
+    columns: List[str] = None,
+    height: int = 400,
+    search_term: str = None,
+) -> pd.DataFrame:
+    """Create a formatted rankings table for display.
+
+    Args:
+        df: DataFrame with rankings data
+        score_type: Which ranking to sort by
+        columns: Columns to display (uses defaults if None)
+        height: Height of the table in pixels
+        search_term: Optional search term to filter countries
+
+    Returns:
+        Filtered and formatted DataFrame
+    """
+    display_cols, rows = plan_rankings_view(
+        df, score_type=score_type, columns=columns, search_term=search_term
+    )
+
+    # Filter, sort and project in one materialization
+    return df.iloc[rows, df.columns.get_indexer(display_cols)]
+
+
+def format_population(population: pd.Series) -> pd.Series:
+    """Format population counts with thousands separators.
 
-    return display_df
+    Args:
+        population: Population counts, possibly with missing values
+
+    Returns:
+        Series of formatted strings, "" where the count is missing
+    """
+    # One int64 cast for the whole column, then plain ints into the f-string
+    missing = population.isna().to_numpy()
+    counts = population.fillna(0) if missing.any() else population
+    labels = [f"{count:,}" for count in counts.astype(np.int64).tolist()]
+
+    for pos in np.flatnonzero(missing):
+        labels[pos] = ""
+
+    return pd.Series(labels, index=population.index, dtype=str)
 
 
 def format_rankings_dataframe(df: pd.DataFrame) -> pd.DataFrame:
@@ -71,8 +135,6 @@ def format_rankings_dataframe(df: pd.DataFrame) -> pd.DataFrame:
     Returns:
         Formatted DataFrame
     """
-    formatted = df.copy()
-
     # Rename columns for display
     column_renames = {
         'country_name': 'Country',
@@ -88,22 +150,78 @@ def format_rankings_dataframe(df: pd.DataFrame) -> pd.DataFrame:
         'primary_religion': 'Religion',
     }
 
-    formatted = formatted.rename(columns=column_renames)
+    if 'population_fmt' in df.columns:
+        # Population was formatted once at load; show that column instead
+        return df.drop(columns='population', errors='ignore').rename(
+            columns={**column_renames, 'population_fmt': 'Population'}
+        )
+
+    # rename shares the column data under copy-on-write, so only the
+    # reformatted Population column is newly allocated
+    formatted = df.rename(columns=column_renames)
 
     # Format population with commas
     if 'Population' in formatted.columns:
-        formatted['Population'] = formatted['Population'].apply(
-            lambda x: f"{int(x):,}" if pd.notna(x) else ""
-        )
+        formatted = formatted.assign(Population=format_population(formatted['Population']))
 
     return formatted
 
 
+@st.cache_data(show_spinner=False, max_entries=16)
+def _sorted_view(_df: pd.DataFrame, df_token: str, score_type: str) -> pd.DataFrame:
+    """Sort the rankings by one score type's rank once and reuse it across reruns.
+
+    Args:
+        _df: DataFrame with rankings data (not hashed; identified by ``df_token``)
+        df_token: Content hash identifying ``_df``
+        score_type: Which ranking to sort by
+
+    Returns:
+        DataFrame sorted by ``{score_type}_rank``, or ``_df`` if it has no such column
+    """
+    rank_col = f'{score_type}_rank'
+    if rank_col not in _df.columns:
+        return _df
+    return _df.sort_values(rank_col, kind='stable')
+
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def _build_table(
+    _df: pd.DataFrame,
+    df_token: str,
+    score_type: str,
+    search_term: str,
+    columns: Optional[Tuple[str, ...]] = None,
+) -> pd.DataFrame:
+    """Filter, sort and format the rankings table, memoized per search term.
+
+    Args:
+        _df: DataFrame with rankings data (not hashed; identified by ``df_token``)
+        df_token: Content hash identifying ``_df``
+        score_type: Which ranking to sort by
+        search_term: Search term to filter countries, or "" for no filter
+        columns: Columns to display (uses defaults if None)
+
+    Returns:
+        Formatted DataFrame ready for display
+    """
+    display_cols, rows = plan_rankings_view(
+        _df,
+        score_type=score_type,
+        columns=list(columns) if columns else None,
+        search_term=search_term,
+    )
+    view = _df.iloc[rows, _df.columns.get_indexer(display_cols)]
+    return format_rankings_dataframe(view)
+
+
 def display_rankings_table(
     df: pd.DataFrame,
     score_type: str = 'combined',
     search_enabled: bool = True,
     page_size: int = 20,
+    df_token: Optional[str] = None,
+    columns: List[str] = None,
 ) -> Optional[str]:
     """Display an interactive rankings table in Streamlit.
 
@@ -112,6 +230,8 @@ def display_rankings_table(
         score_type: Which ranking to display/sort by
         search_enabled: Whether to show search box
         page_size: Number of rows per page
+        df_token: Content hash identifying ``df``; computed if not given
+        columns: Columns to display (uses defaults if None)
 
     Returns:
         Selected country name if a row is clicked, None otherwise
@@ -122,18 +242,40 @@ def display_rankings_table(
         search_term = st.text_input(
             "Search countries",
             placeholder="Type to search...",
+            help=f"Enter at least {MIN_SEARCH_LENGTH} characters",
             key=f"search_{score_type}"
         )
 
-    # Get filtered table
-    table_df = create_rankings_table(
-        df,
-        score_type=score_type,
-        search_term=search_term
+    if df_token is None:
+        df_token = str(pd.util.hash_pandas_object(df, index=False).sum())
+
+    # The match is case-insensitive, so normalize the term for the cache key.
+    # Short terms are not filtered on and share the unfiltered entry.
+    search_term = (search_term or "").strip().lower()
+    if len(search_term) < MIN_SEARCH_LENGTH:
+        search_term = ""
+
+    # Get the filtered and formatted table, reused across reruns. Frames the
+    # caller already sorted by this rank skip the sorted copy.
+    rank_col = f'{score_type}_rank'
+    if rank_col in df.columns and not df[rank_col].is_monotonic_increasing:
+        df = _sorted_view(df, df_token, score_type)
+    display_df = _build_table(
+        df, df_token, score_type, search_term, tuple(columns) if columns else None
     )
 
-    # Format for display
-    display_df = format_rankings_dataframe(table_df)
+    # Send only the current page to the browser
+    n_pages = max(1, -(-len(display_df) // page_size))
+    if n_pages > 1:
+        page = st.number_input(
+            f"Page (of {n_pages})",
+            min_value=1,
+            max_value=n_pages,
+            value=1,
+            key=f"rankings_page_{score_type}",
+        )
+        start = (int(page) - 1) * page_size
+        display_df = display_df.iloc[start:start + page_size]
 
     # Display with Streamlit
     st.dataframe(
@@ -141,14 +283,19 @@ def display_rankings_table(
         use_container_width=True,
         height=400,
         hide_index=True,
+        key=f"rankings_table_{score_type}",  # Stable identity across reruns
     )
 
     return None
 
 
+@lru_cache(maxsize=4)
 def get_column_config(score_type: str = 'combined') -> dict:
     """Get Streamlit column configuration for rankings table.
 
+    Built once per score type and shared across reruns; callers must not
+    mutate the returned dict.
+
     Args:
         score_type: Type of score being displayed
 